@@ -1,4 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from general.problem_solver_interface import IProblemSolver
 
 string_to_digit_lookup_dict: Dict[str, int] = {
     "zero": 0,
@@ -13,24 +15,74 @@ string_to_digit_lookup_dict: Dict[str, int] = {
     "nine": 9,
 }
 
-
-def try_parse_int(value):
-    try:
-        return int(value), True
-    except ValueError:
-        return value, False
-
-
-def try_parse_digit(index, text):
-    try:
-        return int(text[index]), True
-    except ValueError:
-        substring = text[index:]
-        for digit_string in string_to_digit_lookup_dict.keys():
-            if substring.startswith(digit_string):
-                digit = string_to_digit_lookup_dict.get(digit_string)
-                return digit, True
-        return text, False
+digit_char_lookup_dict: Dict[str, int] = {str(digit): digit for digit in range(10)}
+
+
+class DigitAutomaton:
+    # Aho-Corasick automaton with the failure links folded into the transitions, so scanning is one dict lookup
+    # per character. None of the patterns contains another one, so the first match to end is also the first to start
+    def __init__(self, patterns: Dict[str, int]):
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.outputs: List[Optional[int]] = [None]
+        for pattern, value in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = self.transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(self.transitions)
+                    self.transitions.append({})
+                    self.outputs.append(None)
+                    self.transitions[state][char] = next_state
+                state = next_state
+            self.outputs[state] = value
+        self._add_failure_transitions()
+
+    def _add_failure_transitions(self):
+        failure = [0] * len(self.transitions)
+        queue = list(self.transitions[0].values())
+        for state in queue:
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = failure[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = failure[fallback]
+                failure[next_state] = self.transitions[fallback].get(char, 0)
+                if self.outputs[next_state] is None:
+                    self.outputs[next_state] = self.outputs[failure[next_state]]
+        # breadth first order guarantees the failure state of every state is complete before the state itself
+        for state in queue:
+            for char, next_state in self.transitions[failure[state]].items():
+                self.transitions[state].setdefault(char, next_state)
+
+    def find_first(self, text) -> Optional[int]:
+        transitions = self.transitions
+        outputs = self.outputs
+        state = 0
+        for char in text:
+            state = transitions[state].get(char, 0)
+            value = outputs[state]
+            if value is not None:
+                return value
+        return None
+
+
+class DigitScanner:
+    def __init__(self, patterns: Dict[str, int]):
+        self.forward = DigitAutomaton(patterns)
+        self.backward = DigitAutomaton({pattern[::-1]: value for pattern, value in patterns.items()})
+
+    def first_digit(self, text: str) -> Optional[int]:
+        return self.forward.find_first(text)
+
+    def last_digit(self, text: str) -> Optional[int]:
+        return self.backward.find_first(reversed(text))
+
+    def calibration_value(self, text: str) -> int:
+        return 10 * self.first_digit(text) + self.last_digit(text)
+
+
+digit_scanner = DigitScanner(digit_char_lookup_dict)
+digit_and_word_scanner = DigitScanner({**digit_char_lookup_dict, **string_to_digit_lookup_dict})
 
 
 def read_lines(file_name: str):
@@ -43,61 +95,40 @@ def read_lines(file_name: str):
 
 
 def get_first_digit(text: str) -> int:
-    for char in text:
-        res, success = try_parse_int(char)
-        if success:
-            return res
+    return digit_scanner.first_digit(text)
 
 
 def get_first_digit_2(text: str) -> int:
-    for index in range(len(text)):
-        res, success = try_parse_digit(index, text)
-        if success:
-            return res
-
+    return digit_and_word_scanner.first_digit(text)
 
-def get_last_digit_2(text:str) -> int:
-    for index in range(len(text)-1, -1, -1):
-        res, success = try_parse_digit(index, text)
-        if success:
-            return res
 
-
-def reverse(text: str) -> str:
-    return text[::-1]
+def get_last_digit_2(text: str) -> int:
+    return digit_and_word_scanner.last_digit(text)
 
 
 def get_last_digit(text: str):
-    text_reversed = reverse(text)
-    return get_first_digit(text_reversed)
+    return digit_scanner.last_digit(text)
 
 
 def solve_first_problem(file_name: str) -> int:
     lines = read_lines(file_name)
-    numbers: List[int] = []
-    for line in lines:
-        first_digit = get_first_digit(line)
-        last_digit = get_last_digit(line)
-        combined_number = 10*first_digit + last_digit
-        numbers.append(combined_number)
-    return sum(numbers)
+    return sum(digit_scanner.calibration_value(line) for line in lines)
 
 
 def solve_second_problem(file_name: str) -> int:
     lines = read_lines(file_name)
-    numbers: List[int] = []
-    for line in lines:
-        first_digit = get_first_digit_2(line)
-        last_digit = get_last_digit_2(line)
-        combined_number = 10*first_digit + last_digit
-        numbers.append(combined_number)
-    return sum(numbers)
+    return sum(digit_and_word_scanner.calibration_value(line) for line in lines)
+
+
+class ProblemSolverDay1(IProblemSolver):
+
+    def solve_part_1(self):
+        return sum(digit_scanner.calibration_value(line) for line in self.input.iter_lines())
+
+    def solve_part_2(self):
+        return sum(digit_and_word_scanner.calibration_value(line) for line in self.input.iter_lines())
 
 
 if __name__ == '__main__':
-    input_file_name = "input.txt"
-    # input_file_name = "smaller_input.txt"
-    result = solve_first_problem(input_file_name)
-    print(result)
-    result2 = solve_second_problem(input_file_name)
-    print(result2)
+    print(ProblemSolverDay1(use_smaller_input=True).solve())
+    print(ProblemSolverDay1(use_smaller_input=False).solve())
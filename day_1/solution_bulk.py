@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from day_1.solution import string_to_digit_lookup_dict
+from general.input_source import InputSource
+from general.problem_solver_interface import IProblemSolver
+
+NEWLINE = ord("\n")
+ZERO = ord("0")
+NO_DIGIT = -1
+BULK_CHUNK_SIZE = 4 * 1024 * 1024
+PARALLEL_MIN_BYTES = 4 * BULK_CHUNK_SIZE
+
+
+def digit_values(raw: np.ndarray, include_words: bool) -> np.ndarray:
+    # the digit starting at every position, or NO_DIGIT. Words never contain a newline, so they cannot span lines
+    digits = (raw - ZERO).view(np.int8)
+    values = np.where(digits.view(np.uint8) < 10, digits, np.int8(NO_DIGIT))
+    if include_words:
+        for word, digit in string_to_digit_lookup_dict.items():
+            # narrow down the rare positions matching the first letter instead of comparing every byte per letter
+            candidates = np.flatnonzero(raw[:max(0, len(raw) - len(word) + 1)] == ord(word[0]))
+            for offset in range(1, len(word)):
+                candidates = candidates[raw[candidates + offset] == ord(word[offset])]
+            values[candidates] = digit
+    return values
+
+
+def bulk_calibration_sum(buffer, include_words: bool = False) -> int:
+    # only whole lines: a running count of newlines gives the line of every digit, and since the digit positions are
+    # sorted, a line's first and last digit are where that line number starts and stops repeating
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    values = digit_values(raw, include_words)
+    digit_positions = np.flatnonzero(values != NO_DIGIT)
+    if len(digit_positions) == 0:
+        return 0
+    line_of_digit = np.cumsum(raw == NEWLINE, dtype=np.int64)[digit_positions]
+    line_changes = line_of_digit[1:] != line_of_digit[:-1]
+    is_first_in_line = np.concatenate(([True], line_changes))
+    is_last_in_line = np.concatenate((line_changes, [True]))
+
+    first_digits = values[digit_positions[is_first_in_line]]
+    last_digits = values[digit_positions[is_last_in_line]]
+    return 10 * int(first_digits.sum(dtype=np.int64)) + int(last_digits.sum(dtype=np.int64))
+
+
+def range_calibration_sum(file_name: str, start: int, end: int, include_words: bool = False) -> int:
+    # start must be the start of a line; memory stays at one chunk however large the range is
+    chunks = InputSource(file_name).iter_chunks(BULK_CHUNK_SIZE, start, end)
+    return sum(bulk_calibration_sum(chunk, include_words) for chunk in chunks)
+
+
+def parallel_calibration_sum(source: InputSource, include_words: bool = False, workers: Optional[int] = None) -> int:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or source.size() < PARALLEL_MIN_BYTES:
+        return range_calibration_sum(source.file_name, 0, source.size(), include_words)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(range_calibration_sum, source.file_name, start, end, include_words)
+                   for start, end in source.byte_ranges(workers)]
+        return sum(future.result() for future in futures)
+
+
+class ProblemSolverDay1Bulk(IProblemSolver):
+
+    def solve_part_1(self):
+        return sum(bulk_calibration_sum(chunk) for chunk in self.input.iter_chunks(BULK_CHUNK_SIZE))
+
+    def solve_part_2(self):
+        return sum(bulk_calibration_sum(chunk, include_words=True) for chunk in self.input.iter_chunks(BULK_CHUNK_SIZE))
+
+
+class ProblemSolverDay1Parallel(IProblemSolver):
+    workers: Optional[int] = None
+
+    def solve_part_1(self):
+        return parallel_calibration_sum(self.input, workers=self.workers)
+
+    def solve_part_2(self):
+        return parallel_calibration_sum(self.input, include_words=True, workers=self.workers)
+
+
+if __name__ == '__main__':
+    print(ProblemSolverDay1Bulk(use_smaller_input=True).solve())
+    print(ProblemSolverDay1Bulk(use_smaller_input=False).solve())
+    print(ProblemSolverDay1Parallel(use_smaller_input=False).solve())
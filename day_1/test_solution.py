@@ -0,0 +1,32 @@
+import pytest
+from day_1.solution import digit_and_word_scanner, digit_scanner
+
+
+@pytest.mark.parametrize("text, expected_first_digit, expected_last_digit", [
+    ("two1nine", 2, 9),
+    ("eightwothree", 8, 3),
+    ("abcone2threexyz", 1, 3),
+    ("xtwone3four", 2, 4),
+    ("4nineeightseven2", 4, 2),
+    ("zoneight234", 1, 4),
+    ("7pqrstsixteen", 7, 6),
+    ("twone", 2, 1),
+    ("oneight", 1, 8),
+    ("sevenine", 7, 9),
+    ("threeeighthree", 3, 3),
+])
+def test_digit_and_word_scanner_should_handle_overlapping_words(text, expected_first_digit, expected_last_digit):
+    # act
+    first_digit = digit_and_word_scanner.first_digit(text)
+    last_digit = digit_and_word_scanner.last_digit(text)
+
+    # assert
+    assert (first_digit, last_digit) == (expected_first_digit, expected_last_digit)
+
+
+def test_digit_scanner_should_ignore_words():
+    # act
+    result = digit_scanner.calibration_value("one2three4five")
+
+    # assert
+    assert result == 24
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+import day_1.solution_bulk as solution_bulk
+from day_1.solution import ProblemSolverDay1
+from general.input_generators import generate_day_1
+
+
+@pytest.fixture
+def input_file_name(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(generate_day_1(2000, random.Random(1)))
+    return str(input_file)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1000, solution_bulk.BULK_CHUNK_SIZE])
+def test_bulk_should_match_scanner(input_file_name, monkeypatch, chunk_size):
+    # arrange: chunks smaller than a line have to be carried over into the next read
+    monkeypatch.setattr(solution_bulk, "BULK_CHUNK_SIZE", chunk_size)
+
+    # act
+    bulk_solution = solution_bulk.ProblemSolverDay1Bulk(input_file_name=input_file_name).solve()
+
+    # assert
+    assert bulk_solution == ProblemSolverDay1(input_file_name=input_file_name).solve()
+
+
+def test_parallel_should_match_scanner(input_file_name, monkeypatch):
+    # arrange
+    monkeypatch.setattr(solution_bulk, "PARALLEL_MIN_BYTES", 0)
+    monkeypatch.setattr(solution_bulk.ProblemSolverDay1Parallel, "workers", 3)
+
+    # act
+    parallel_solution = solution_bulk.ProblemSolverDay1Parallel(input_file_name=input_file_name).solve()
+
+    # assert
+    assert parallel_solution == ProblemSolverDay1(input_file_name=input_file_name).solve()
+
+
+@pytest.mark.parametrize("text", ["1th", "two1\n5se", "7\nnine5five\n5se"])
+def test_bulk_should_handle_chunks_shorter_than_a_word(tmp_path, text):
+    # arrange: the last line, without a newline, is a chunk of its own
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(text)
+    input_file_name = str(input_file)
+
+    # act
+    bulk_solution = solution_bulk.ProblemSolverDay1Bulk(input_file_name=input_file_name).solve()
+
+    # assert
+    assert bulk_solution == ProblemSolverDay1(input_file_name=input_file_name).solve()
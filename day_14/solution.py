@@ -1,9 +1,9 @@
 import attr
 import numpy as np
-import time
 from enum import StrEnum
 from typing import List, Tuple
 
+from general.grid import load_grid
 from general.problem_solver_interface import IProblemSolver
 
 
@@ -14,17 +14,17 @@ class Position(StrEnum):
     EMPTY_SPACE = "."
 
 
-def lines_to_array(lines: List[str]) -> np.ndarray:
-    return np.array([[char for char in line] for line in lines], str)
+ROUND_ROCK = ord(Position.ROUND_ROCK)
+EMPTY_SPACE = ord(Position.EMPTY_SPACE)
 
 
 def try_move_to_north(row_index: int, column_index: int, field: np.ndarray):
     entry = field[row_index][column_index]
-    if entry != "O" or row_index == 0:
+    if entry != ROUND_ROCK or row_index == 0:
         return
 
     northern_neighbouring_entry = field[row_index-1][column_index]
-    if northern_neighbouring_entry != ".":
+    if northern_neighbouring_entry != EMPTY_SPACE:
         return
 
     field[row_index, column_index], field[row_index-1, column_index] = \
@@ -60,7 +60,7 @@ def count_points(field: np.ndarray):
     for row_index in range(row_count):
         points_per_round_rock = row_count - row_index
         field_row: np.array = field[row_index]
-        rock_count = (field_row == "O").sum()
+        rock_count = (field_row == ROUND_ROCK).sum()
         points = rock_count * points_per_round_rock
         total_points += points
     return total_points
@@ -68,24 +68,24 @@ def count_points(field: np.ndarray):
 
 class ProblemSolver(IProblemSolver):
 
+    def parse(self) -> np.ndarray:
+        return load_grid(self.input)
+
     def solve_part_1(self):
-        field = lines_to_array(self.lines)
+        field = np.copy(self.parsed)
         slide_rocks_to_north(field)
         return count_points(field)
 
     N_CYCLES = 1_000_000_000
     def solve_part_2(self, n_cycles=100):
-        print("part 2")
-        field = lines_to_array(self.lines)
+        field = self.parsed
         repetitive_cycle_was_found = False
-        start_time = time.time()
         found_fields_per_score: dict[int, List[Tuple[np.ndarray, int]]] = {}  # dict(points, list[(field, cycle_number)]
         for cycle in range(1, 1000):
             if repetitive_cycle_was_found:
                 break
             field = complete_cycle(np.copy(field))
             score = count_points(field)
-            print(f"score: {score}, cycle: {cycle}")
             found_field_and_cycle_tuples = found_fields_per_score.get(score, [])
             for found_field, found_field_cycle in found_field_and_cycle_tuples:
                 if np.array_equal(found_field, field):
@@ -108,10 +108,6 @@ class ProblemSolver(IProblemSolver):
             if cycle_count == cycle_number_of_millionth_field:
                 millionth_field = field
                 break
-
-        end_time = time.time()
-        time_delta = end_time - start_time
-        print(f"time elapsed: {time_delta} s")
         return count_points(millionth_field)
 
 
@@ -2,9 +2,10 @@ import queue
 from typing import List, Literal, Dict, get_args, Tuple
 
 import attr
+import numpy as np
 
 from general.problem_solver_interface import IProblemSolver
-from general.utils import lines_to_int_array
+from general.grid import load_grid
 
 Direction = Literal["N", "E", "S", "W"]
 
@@ -63,8 +64,11 @@ class DijkstraInfo:
 
 class ProblemSolver(IProblemSolver):
 
+    def parse(self) -> np.ndarray:
+        return load_grid(self.input, digits=True)
+
     def solve_part_1(self):
-        input_array = lines_to_int_array(self.lines)
+        input_array = self.parsed
         destination_row, destination_col = input_array.shape
         destination_col -= 1
         destination_row -= 1
@@ -103,7 +107,7 @@ class ProblemSolver(IProblemSolver):
                 # if next_node in visited_nodes:
                 if visited_nodes.get(node_to_tuple(next_node), None) is not None:
                     continue
-                next_distance = current_dist + input_array[row, col]
+                next_distance = current_dist + int(input_array[row, col])
                 dijkstra_info = DijkstraInfo(previous_node=current_node, shortest_path=next_distance)
 
                 visited_nodes[node_to_tuple(next_node)] = dijkstra_info
@@ -53,14 +53,17 @@ class Game:
 
 class ProblemSolverDay2(IProblemSolver):
 
-    def solve_part_1(self, lines: List[str]):
+    def parse(self) -> List[Game]:
+        return [Game.from_line(line) for line in self.lines]
+
+    def solve_part_1(self):
         bag_contents = CubeSet(red=12, green=13, blue=14)
-        games = [Game.from_line(line) for line in lines]
+        games: List[Game] = self.parsed
         valid_game_ids = [game.id for game in games if game.is_possible(bag_contents)]
         return sum(valid_game_ids)
 
-    def solve_part_2(self, lines: List[str]):
-        games = [Game.from_line(line) for line in lines]
+    def solve_part_2(self):
+        games: List[Game] = self.parsed
         powers = [game.compute_power() for game in games]
         return sum(powers)
 
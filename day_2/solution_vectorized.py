@@ -0,0 +1,182 @@
+from bisect import bisect_left, bisect_right
+from functools import cached_property
+from typing import List, Set, Tuple
+
+import numpy as np
+
+from day_2.solution import CubeSet
+from general.grid import find_digit_runs
+from general.problem_solver_interface import IProblemSolver
+
+COLORS = ("red", "green", "blue")
+GAME_ID_TERMINATOR = ord(":")
+
+
+def bag_to_array(bag_contents: CubeSet) -> np.ndarray:
+    return np.array([bag_contents.red, bag_contents.green, bag_contents.blue], dtype=np.int64)
+
+
+class GameTable:
+    # one row per game: its id and the minimal bag (max red, green, blue over all of its draws)
+    def __init__(self, ids: np.ndarray, minimal_bags: np.ndarray):
+        self.ids = ids
+        self.minimal_bags = minimal_bags
+
+    def is_possible(self, bag_contents: CubeSet) -> np.ndarray:
+        return (self.minimal_bags <= bag_to_array(bag_contents)).all(axis=1)
+
+    def compute_powers(self) -> np.ndarray:
+        return self.minimal_bags.prod(axis=1)
+
+    @staticmethod
+    def from_buffer(buffer) -> 'GameTable':
+        # every number is either a game id (followed by ":") or a cube count (followed by " " and its color),
+        # and every cube count belongs to the last game id before it
+        raw = np.frombuffer(buffer, dtype=np.uint8)
+        _, ends, values = find_digit_runs(raw)
+        is_game = raw[ends] == GAME_ID_TERMINATOR
+        game_index = np.cumsum(is_game) - 1
+        is_cubes = ~is_game
+        color_initials = raw[ends[is_cubes] + 1]
+        color_index = np.zeros(len(color_initials), dtype=np.int64)
+        for index, color in enumerate(COLORS):
+            color_index[color_initials == ord(color[0])] = index
+
+        ids = values[is_game]
+        minimal_bags = np.zeros((len(ids), len(COLORS)), dtype=np.int64)
+        np.maximum.at(minimal_bags, (game_index[is_cubes], color_index), values[is_cubes])
+        return GameTable(ids=ids, minimal_bags=minimal_bags)
+
+
+class GreenBlueFenwickTree:
+    # A Fenwick tree over the green ranks whose nodes are Fenwick trees over the blue values that can ever be added
+    # to them, so memory is O(points log points) and every add and query takes O(log² points)
+    def __init__(self, points: List[Tuple[int, int]]):
+        self.green_axis = sorted({green for green, _ in points})
+        node_blues: List[Set[int]] = [set() for _ in range(len(self.green_axis) + 1)]
+        for green, blue in points:
+            node = bisect_left(self.green_axis, green) + 1
+            while node < len(node_blues):
+                node_blues[node].add(blue)
+                node += node & -node
+        self.node_blues = [sorted(blues) for blues in node_blues]
+        self.node_counts = [[0] * (len(blues) + 1) for blues in self.node_blues]
+        self.node_id_sums = [[0] * (len(blues) + 1) for blues in self.node_blues]
+
+    def add(self, green: int, blue: int, game_id: int):
+        node = bisect_left(self.green_axis, green) + 1
+        while node < len(self.node_blues):
+            blues, counts, id_sums = self.node_blues[node], self.node_counts[node], self.node_id_sums[node]
+            position = bisect_left(blues, blue) + 1
+            while position <= len(blues):
+                counts[position] += 1
+                id_sums[position] += game_id
+                position += position & -position
+            node += node & -node
+
+    def query(self, green: int, blue: int) -> Tuple[int, int]:
+        # count and id sum of the added points with at most this green and at most this blue
+        count, id_sum = 0, 0
+        node = bisect_right(self.green_axis, green)
+        while node > 0:
+            blues, counts, id_sums = self.node_blues[node], self.node_counts[node], self.node_id_sums[node]
+            position = bisect_right(blues, blue)
+            while position > 0:
+                count += counts[position]
+                id_sum += id_sums[position]
+                position -= position & -position
+            node -= node & -node
+        return count, id_sum
+
+
+class GameDominanceIndex:
+    # A game is possible with a bag exactly when its minimal bag is dominated by the bag on all three colors.
+    # Every color axis is compressed to the distinct values that occur, and a 3-D prefix sum over the compressed
+    # grid turns "how many games / which id sum is dominated by (r, g, b)" into three binary searches and one lookup.
+    # The two int64 tables take 16 bytes per cell, so past MAX_TABLE_CELLS (32 MiB) queries are answered offline
+    # instead: games and bags are visited in order of red, and a bag is looked up in a GreenBlueFenwickTree holding
+    # exactly the games with at most its red, in O((games + bags) log² games) time and O(games log games) memory
+    MAX_TABLE_CELLS = 1 << 21
+
+    def __init__(self, games: GameTable):
+        self.games = games
+        self.axes = [np.unique(games.minimal_bags[:, color]) for color in range(len(COLORS))]
+        shape = tuple(len(axis) for axis in self.axes)
+        self.uses_table = int(np.prod(shape)) <= GameDominanceIndex.MAX_TABLE_CELLS
+        if not self.uses_table:
+            return
+        ranks = tuple(np.searchsorted(axis, games.minimal_bags[:, color]) for color, axis in enumerate(self.axes))
+        self.counts = np.zeros(shape, dtype=np.int64)
+        self.id_sums = np.zeros(shape, dtype=np.int64)
+        np.add.at(self.counts, ranks, 1)
+        np.add.at(self.id_sums, ranks, games.ids)
+        for axis in range(len(COLORS)):
+            self.counts = np.cumsum(self.counts, axis=axis)
+            self.id_sums = np.cumsum(self.id_sums, axis=axis)
+
+    def query(self, bags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # bags: (n, 3) array of (red, green, blue); returns the possible game count and id sum per bag
+        bags = np.atleast_2d(np.asarray(bags, dtype=np.int64))
+        if not self.uses_table:
+            return self._sweep(bags)
+        ranks = [np.searchsorted(axis, bags[:, color], side="right") - 1 for color, axis in enumerate(self.axes)]
+        has_possible_games = np.all([rank >= 0 for rank in ranks], axis=0)
+        counts = np.zeros(len(bags), dtype=np.int64)
+        id_sums = np.zeros(len(bags), dtype=np.int64)
+        valid_ranks = tuple(rank[has_possible_games] for rank in ranks)
+        counts[has_possible_games] = self.counts[valid_ranks]
+        id_sums[has_possible_games] = self.id_sums[valid_ranks]
+        return counts, id_sums
+
+    def _sweep(self, bags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        minimal_bags = self.games.minimal_bags.tolist()
+        ids = self.games.ids.tolist()
+        tree = GreenBlueFenwickTree([(green, blue) for _, green, blue in minimal_bags])
+        game_order = np.argsort(self.games.minimal_bags[:, 0], kind="stable").tolist()
+        counts = np.zeros(len(bags), dtype=np.int64)
+        id_sums = np.zeros(len(bags), dtype=np.int64)
+        added_game_count = 0
+        bag_list = bags.tolist()
+        for bag_index in np.argsort(bags[:, 0], kind="stable").tolist():
+            red, green, blue = bag_list[bag_index]
+            while added_game_count < len(game_order) and minimal_bags[game_order[added_game_count]][0] <= red:
+                game = game_order[added_game_count]
+                tree.add(minimal_bags[game][1], minimal_bags[game][2], ids[game])
+                added_game_count += 1
+            counts[bag_index], id_sums[bag_index] = tree.query(green, blue)
+        return counts, id_sums
+
+
+class ProblemSolverDay2Vectorized(IProblemSolver):
+
+    def parse(self) -> GameTable:
+        return GameTable.from_buffer(self.input.buffer())
+
+    @cached_property
+    def dominance_index(self) -> GameDominanceIndex:
+        return GameDominanceIndex(self.parsed)
+
+    def count_possible_games(self, bag_contents: CubeSet) -> int:
+        counts, _ = self.dominance_index.query(bag_to_array(bag_contents))
+        return int(counts[0])
+
+    def sum_possible_game_ids(self, bag_contents: CubeSet) -> int:
+        _, id_sums = self.dominance_index.query(bag_to_array(bag_contents))
+        return int(id_sums[0])
+
+    def query_bags(self, bags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return self.dominance_index.query(bags)
+
+    def solve_part_1(self):
+        bag_contents = CubeSet(red=12, green=13, blue=14)
+        games: GameTable = self.parsed
+        return int(games.ids[games.is_possible(bag_contents)].sum())
+
+    def solve_part_2(self):
+        games: GameTable = self.parsed
+        return int(games.compute_powers().sum())
+
+
+if __name__ == '__main__':
+    print(ProblemSolverDay2Vectorized(use_smaller_input=True).solve())
+    print(ProblemSolverDay2Vectorized(use_smaller_input=False).solve())
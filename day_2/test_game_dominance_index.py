@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from day_2.solution import CubeSet, Game
+from day_2.solution_vectorized import GameDominanceIndex, GameTable, ProblemSolverDay2Vectorized, bag_to_array
+from general.input_generators import generate_day_2
+
+
+@pytest.fixture
+def solver(tmp_path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(generate_day_2(300, random.Random(2)))
+    return ProblemSolverDay2Vectorized(input_file_name=str(input_file))
+
+
+def brute_force(solver: ProblemSolverDay2Vectorized, bag_contents: CubeSet):
+    games = [Game.from_line(line) for line in solver.lines]
+    possible_ids = [game.id for game in games if game.is_possible(bag_contents)]
+    return len(possible_ids), sum(possible_ids)
+
+
+@pytest.mark.parametrize("max_table_cells", [GameDominanceIndex.MAX_TABLE_CELLS, 0])
+def test_query_bags_should_match_brute_force(solver, monkeypatch, max_table_cells):
+    # arrange
+    monkeypatch.setattr(GameDominanceIndex, "MAX_TABLE_CELLS", max_table_cells)
+    rng = random.Random(7)
+    bags = [CubeSet(red=rng.randint(0, 22), green=rng.randint(0, 22), blue=rng.randint(0, 22)) for _ in range(200)]
+
+    # act
+    counts, id_sums = solver.query_bags(np.array([bag_to_array(bag) for bag in bags]))
+
+    # assert
+    expected = [brute_force(solver, bag) for bag in bags]
+    assert list(zip(counts.tolist(), id_sums.tolist())) == expected
+
+
+def test_single_bag_queries_should_match_part_1(solver):
+    # arrange
+    bag_contents = CubeSet(red=12, green=13, blue=14)
+
+    # act
+    id_sum = solver.sum_possible_game_ids(bag_contents)
+
+    # assert
+    assert id_sum == solver.solve_part_1()
+    assert solver.count_possible_games(bag_contents) == brute_force(solver, bag_contents)[0]
+
+
+@pytest.mark.parametrize("bag_count", [0, 1, 500])
+def test_sweep_should_match_table(monkeypatch, bag_count):
+    # arrange
+    rng = np.random.default_rng(15)
+    games = GameTable(ids=np.arange(1, 401), minimal_bags=rng.integers(0, 100, size=(400, 3)))
+    bags = rng.integers(0, 110, size=(bag_count, 3))
+    table_index = GameDominanceIndex(games)
+    monkeypatch.setattr(GameDominanceIndex, "MAX_TABLE_CELLS", 0)
+
+    # act
+    counts, id_sums = GameDominanceIndex(games).query(bags)
+
+    # assert
+    expected_counts, expected_id_sums = table_index.query(bags)
+    assert table_index.uses_table
+    assert counts.tolist() == expected_counts.tolist()
+    assert id_sums.tolist() == expected_id_sums.tolist()
@@ -1,27 +1,39 @@
-from typing import List
+import re
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Set, Tuple
 
 from general.problem_solver_interface import IProblemSolver
 from general.utils import try_parse_int
 
+NO_NUMBER = -1
+NEIGHBOUR_OFFSETS = [(row_offset, col_offset)
+                     for row_offset in (-1, 0, 1)
+                     for col_offset in (-1, 0, 1)
+                     if (row_offset, col_offset) != (0, 0)]
+NUMBER_PATTERN = re.compile(r"\d+")
+
 
 class ProblemSolverDay3(IProblemSolver):
 
-    def solve_part_2(self, lines: List[str]):
-        array = ProblemSolverDay3.lines_to_array(lines)
+    def parse(self) -> Tuple[List[List[str]], List['ArrayNumber'], List[List[int]]]:
+        array = ProblemSolverDay3.lines_to_array(self.lines)
         numbers = ArrayHelper.get_numbers(array)
+        return array, numbers, ArrayHelper.get_label_grid(array, numbers)
+
+    def solve_part_2(self):
+        array, numbers, labels = self.parsed
         stars = ArrayHelper.get_stars(array)
         total = 0
         for star in stars:
-            gear_ratio, success = star.try_get_gear_ration(numbers)
+            gear_ratio, success = star.try_get_gear_ration(numbers, labels)
             if success:
                 total += gear_ratio
         return total
 
-    def solve_part_1(self, lines: List[str]):
-        array = ProblemSolverDay3.lines_to_array(lines)
-        numbers = ArrayHelper.get_numbers(array)
-        numbers_filtered = [number for number in numbers if number.touches_symbol()]
-        return sum([array_number.value for array_number in numbers_filtered])
+    def solve_part_1(self):
+        array, numbers, labels = self.parsed
+        touching_ids = ArrayHelper.get_ids_of_numbers_touching_symbol(array, labels)
+        return sum([numbers[number_id].value for number_id in touching_ids])
 
     @staticmethod
     def lines_to_array(lines: List[str]) -> List[List[str]]:
@@ -35,21 +47,11 @@ class ArrayNumber:
                  row: int,
                  col_start: int,
                  col_end: int,
-                 array: List[List[str]],
                  ):
         self.value = value
         self.row = row
         self.col_start = col_start
         self.col_end = col_end
-        self.array = array
-
-    def touches_symbol(self) -> bool:
-        for row in [self.row - 1, self.row, self.row + 1]:
-            for col in range(self.col_start - 1, self.col_end + 2):
-                if 0 <= row < len(self.array) and 0 <= col < len(self.array[row]):
-                    if ArrayHelper.contains_symbol(self.array, row, col):
-                        return True
-        return False
 
     def __str__(self):
         return str(self.value)
@@ -60,28 +62,16 @@ class ArrayStar:
         self.row = row
         self.col = col
 
-    def try_get_gear_ration(self, numbers: List[ArrayNumber]):
-        touching_numbers = [number for number in numbers if self.is_touching(number)]
-        if len(touching_numbers) != 2:
+    def try_get_gear_ration(self, numbers: List[ArrayNumber], labels: List[List[int]]):
+        touching_ids = ArrayHelper.get_neighbouring_number_ids(labels, self.row, self.col)
+        if len(touching_ids) != 2:
             return None, False
-        gear_ratio = touching_numbers[0].value * touching_numbers[1].value
+        first_id, second_id = touching_ids
+        gear_ratio = numbers[first_id].value * numbers[second_id].value
         return gear_ratio, True
 
-    def is_touching(self, array_number: ArrayNumber) -> bool:
-        return (array_number.row - 1 <= self.row <= array_number.row + 1) \
-            and (array_number.col_start - 1 <= self.col <= array_number.col_end + 1)
-
 
 class ArrayHelper:
-    @staticmethod
-    def contains_symbol(array: List[List[str]], row: int, col: int):
-        entry = array[row][col]
-        _, success = try_parse_int(entry)
-        if success:
-            return False
-        else:
-            return entry != "."
-
     @staticmethod
     def get_numbers(array: List[List[str]]) -> List[ArrayNumber]:
         numbers: List[ArrayNumber] = []
@@ -108,12 +98,40 @@ class ArrayHelper:
                             row=row,
                             col_start=start_col,
                             col_end=col-1,
-                            array=array,
                         ))
                         continue
                     number = 10 * number + value
         return numbers
 
+    @staticmethod
+    def get_label_grid(array: List[List[str]], numbers: List[ArrayNumber]) -> List[List[int]]:
+        # labels[row][col] is the index in numbers of the number covering that cell, or NO_NUMBER
+        labels = [[NO_NUMBER] * len(row) for row in array]
+        for number_id, number in enumerate(numbers):
+            for col in range(number.col_start, number.col_end + 1):
+                labels[number.row][col] = number_id
+        return labels
+
+    @staticmethod
+    def get_neighbouring_number_ids(labels: List[List[int]], row: int, col: int) -> Set[int]:
+        number_ids: Set[int] = set()
+        for row_offset, col_offset in NEIGHBOUR_OFFSETS:
+            neighbour_row, neighbour_col = row + row_offset, col + col_offset
+            if 0 <= neighbour_row < len(labels) and 0 <= neighbour_col < len(labels[neighbour_row]):
+                number_id = labels[neighbour_row][neighbour_col]
+                if number_id != NO_NUMBER:
+                    number_ids.add(number_id)
+        return number_ids
+
+    @staticmethod
+    def get_ids_of_numbers_touching_symbol(array: List[List[str]], labels: List[List[int]]) -> Set[int]:
+        touching_ids: Set[int] = set()
+        for row in range(len(array)):
+            for col in range(len(array[row])):
+                if array[row][col] != "." and labels[row][col] == NO_NUMBER:
+                    touching_ids |= ArrayHelper.get_neighbouring_number_ids(labels, row, col)
+        return touching_ids
+
     @staticmethod
     def get_stars(array: List[List[str]]) -> List[ArrayStar]:
         stars: List[ArrayStar] = []
@@ -125,6 +143,69 @@ class ArrayHelper:
         return stars
 
 
+class SchematicRow:
+    def __init__(self, line: str):
+        # numbers as (first col, col after the last digit, value), sorted by col since they come from left to right
+        self.numbers: List[Tuple[int, int, int]] = [(match.start(), match.end(), int(match.group()))
+                                                    for match in NUMBER_PATTERN.finditer(line)]
+        self.number_ends: List[int] = [end for _, end, _ in self.numbers]
+        self.symbol_cols: Set[int] = {col for col, entry in enumerate(line) if entry != "." and not entry.isdigit()}
+        self.star_cols: List[int] = [col for col in self.symbol_cols if line[col] == "*"]
+
+    def get_values_touching(self, col: int) -> List[int]:
+        # the numbers are disjoint, so the first one ending right of col - 1 is found by bisection and at most two
+        # of them fit in the three cols around col
+        values: List[int] = []
+        for start, _, value in self.numbers[bisect_left(self.number_ends, col):]:
+            if start > col + 1:
+                break
+            values.append(value)
+        return values
+
+
+EMPTY_ROW = SchematicRow("")
+
+
+class StreamingSchematic:
+    @staticmethod
+    def iter_windows(lines: Iterable[str]) -> Iterator[Tuple[SchematicRow, SchematicRow, SchematicRow]]:
+        # (above, current, below) per row. Adjacency only reaches one row up and down, so only a window of three
+        # rows is kept and memory does not grow with the number of rows
+        above, current = EMPTY_ROW, None
+        for line in lines:
+            below = SchematicRow(line)
+            if current is not None:
+                yield above, current, below
+                above = current
+            current = below
+        if current is not None:
+            yield above, current, EMPTY_ROW
+
+    @staticmethod
+    def iter_part_number_sums(lines: Iterable[str]) -> Iterator[int]:
+        for above, current, below in StreamingSchematic.iter_windows(lines):
+            window_symbol_cols = above.symbol_cols | current.symbol_cols | below.symbol_cols
+            yield sum(value for start, end, value in current.numbers
+                      if any(col in window_symbol_cols for col in range(start - 1, end + 1)))
+
+    @staticmethod
+    def iter_gear_ratios(lines: Iterable[str]) -> Iterator[int]:
+        for above, current, below in StreamingSchematic.iter_windows(lines):
+            for col in current.star_cols:
+                touching = [value for row in (above, current, below) for value in row.get_values_touching(col)]
+                if len(touching) == 2:
+                    yield touching[0] * touching[1]
+
+
+class ProblemSolverDay3Streaming(IProblemSolver):
+
+    def solve_part_1(self):
+        return sum(StreamingSchematic.iter_part_number_sums(self.input.iter_lines()))
+
+    def solve_part_2(self):
+        return sum(StreamingSchematic.iter_gear_ratios(self.input.iter_lines()))
+
+
 if __name__ == '__main__':
     # result = ProblemSolverDay3(use_smaller_input=True).solve()
     result = ProblemSolverDay3(use_smaller_input=False).solve()
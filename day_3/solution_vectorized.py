@@ -0,0 +1,77 @@
+import numpy as np
+
+from general.grid import ZERO, find_digit_runs, load_grid
+from general.problem_solver_interface import IProblemSolver
+
+DOT = ord(".")
+STAR = ord("*")
+NO_NUMBER = -1
+
+
+class VectorizedSchematic:
+    # The grid gets a border of dots, so digit runs in the flattened grid never continue into the next row
+    # and every cell of the original grid has 8 neighbours at fixed offsets in the flattened grid
+    def __init__(self, grid: np.ndarray):
+        row_count, col_count = grid.shape
+        padded = np.full((row_count + 2, col_count + 2), DOT, dtype=np.uint8)
+        padded[1:-1, 1:-1] = grid
+        self.padded = padded
+        self.flat = padded.ravel()
+        row_stride = col_count + 2
+        self.neighbour_offsets = np.array([row_offset * row_stride + col_offset
+                                           for row_offset in (-1, 0, 1)
+                                           for col_offset in (-1, 0, 1)
+                                           if (row_offset, col_offset) != (0, 0)])
+
+        self.starts, self.ends, self.values = find_digit_runs(self.flat)
+        is_digit = (self.flat - ZERO) < 10
+        self.is_symbol = (self.flat != DOT) & ~is_digit
+        self.labels = np.full(len(self.flat), NO_NUMBER, dtype=np.int64)
+        self.labels[is_digit] = np.repeat(np.arange(len(self.starts)), self.ends - self.starts)
+
+    def dilated_symbol_mask(self) -> np.ndarray:
+        symbols = self.is_symbol.reshape(self.padded.shape)
+        row_count, col_count = symbols.shape[0] - 2, symbols.shape[1] - 2
+        dilated = np.zeros_like(symbols)
+        for row_offset in (-1, 0, 1):
+            for col_offset in (-1, 0, 1):
+                dilated[1:-1, 1:-1] |= symbols[1 + row_offset:1 + row_offset + row_count,
+                                               1 + col_offset:1 + col_offset + col_count]
+        return dilated.ravel()
+
+    def part_number_sum(self) -> int:
+        # a number touches a symbol when any of its cells lies in the dilated symbol mask
+        touched_cells_before = np.concatenate(([0], np.cumsum(self.dilated_symbol_mask(), dtype=np.int64)))
+        touches_symbol = touched_cells_before[self.ends] - touched_cells_before[self.starts] > 0
+        return int(self.values[touches_symbol].sum())
+
+    def gear_ratio_sum(self) -> int:
+        # A number can border a star through up to three cells, so the 8 neighbour labels of a star are sorted and
+        # only counted where they differ from their left neighbour. A gear has exactly two distinct labels: the
+        # largest one is last in its sorted row, the smallest is the row minimum once NO_NUMBER is masked out
+        stars = np.flatnonzero(self.flat == STAR)
+        neighbour_labels = np.sort(self.labels[stars[:, None] + self.neighbour_offsets], axis=1)
+        is_new_label = neighbour_labels != NO_NUMBER
+        is_new_label[:, 1:] &= neighbour_labels[:, 1:] != neighbour_labels[:, :-1]
+        is_gear = is_new_label.sum(axis=1) == 2
+        gear_labels = neighbour_labels[is_gear]
+        largest_labels = gear_labels[:, -1]
+        smallest_labels = np.where(gear_labels == NO_NUMBER, largest_labels[:, None], gear_labels).min(axis=1)
+        return int((self.values[largest_labels] * self.values[smallest_labels]).sum())
+
+
+class ProblemSolverDay3Vectorized(IProblemSolver):
+
+    def parse(self) -> VectorizedSchematic:
+        return VectorizedSchematic(load_grid(self.input))
+
+    def solve_part_1(self):
+        return self.parsed.part_number_sum()
+
+    def solve_part_2(self):
+        return self.parsed.gear_ratio_sum()
+
+
+if __name__ == '__main__':
+    print(ProblemSolverDay3Vectorized(use_smaller_input=True).solve())
+    print(ProblemSolverDay3Vectorized(use_smaller_input=False).solve())
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from day_3.solution import ProblemSolverDay3, ProblemSolverDay3Streaming, SchematicRow
+from day_3.solution_vectorized import ProblemSolverDay3Vectorized
+from general.input_generators import generate_day_3
+
+SOLVER_CLASSES = [ProblemSolverDay3, ProblemSolverDay3Streaming, ProblemSolverDay3Vectorized]
+
+
+def solve_all(tmp_path, schematic: str):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(schematic)
+    return [solver_class(input_file_name=str(input_file)).solve() for solver_class in SOLVER_CLASSES]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_engines_should_agree_on_generated_schematics(tmp_path, seed):
+    # act
+    solutions = solve_all(tmp_path, generate_day_3(150, random.Random(seed)))
+
+    # assert
+    assert all(solution == solutions[0] for solution in solutions)
+
+
+def test_star_touching_one_number_twice_should_not_be_a_gear(tmp_path):
+    # arrange: the left star touches 123 through three cells, the right one touches two different 12s
+    schematic = "\n".join([
+        "123...12.",
+        ".*....*..",
+        "......12.",
+    ])
+
+    # act
+    solutions = solve_all(tmp_path, schematic)
+
+    # assert
+    assert solutions == [{"solution_part_1": 147, "solution_part_2": 144}] * len(SOLVER_CLASSES)
+
+
+@pytest.mark.parametrize("col, expected", [(0, [12]), (2, [12, 45]), (5, [45]), (6, []), (7, [7]), (9, [7]),
+                                           (10, [])])
+def test_row_should_find_values_touching_col(col, expected):
+    # arrange
+    row = SchematicRow("12.45...7")
+
+    # act
+    values = row.get_values_touching(col)
+
+    # assert
+    assert values == expected
@@ -1,5 +1,5 @@
-import math
-from typing import List
+from collections import deque
+from typing import Deque, Iterable, Iterator, List
 
 from general.problem_solver_interface import IProblemSolver
 
@@ -11,16 +11,25 @@ class Card:
                  ):
         self.winning_numbers = winning_numbers
         self.my_numbers = my_numbers
+        # bit n is set when number n is on the card, so the matches are the popcount of an AND
+        self.winning_mask = Card._to_mask(winning_numbers)
+        self.my_mask = Card._to_mask(my_numbers)
 
-    def calculate_points(self):
+    def calculate_points(self) -> int:
         overlapping_number_count = self.count_overlapping_numbers()
         if overlapping_number_count > 0:
-            return math.pow(2, overlapping_number_count-1)
+            return 1 << (overlapping_number_count - 1)
         return 0
 
-    def count_overlapping_numbers(self):
-        overlapping_numbers = [number for number in self.my_numbers if number in self.winning_numbers]
-        return len(overlapping_numbers)
+    def count_overlapping_numbers(self) -> int:
+        return (self.winning_mask & self.my_mask).bit_count()
+
+    @staticmethod
+    def _to_mask(numbers: List[int]) -> int:
+        mask = 0
+        for number in numbers:
+            mask |= 1 << number
+        return mask
 
     @staticmethod
     def from_line(line: str):
@@ -39,23 +48,52 @@ class Card:
         return numbers
 
 
+def iter_copy_counts(match_counts: Iterable[int]) -> Iterator[int]:
+    # The copies of a card are won by the next `match count` cards. Instead of adding them to every one of those
+    # cards, they are added to a running total once and scheduled to drop out of it again, so only the next
+    # max(match count) + 1 drop-outs are kept, however many cards there are
+    active_copies = 0
+    dropping_out: Deque[int] = deque()
+    for match_count in match_counts:
+        if dropping_out:
+            active_copies -= dropping_out.popleft()
+        copies = 1 + active_copies
+        yield copies
+        if match_count > 0:
+            active_copies += copies
+            dropping_out.extend([0] * (match_count + 1 - len(dropping_out)))
+            dropping_out[match_count] += copies
+
+
 class ProblemSolverDay4(IProblemSolver):
 
-    def solve_part_1(self, lines: List[str]):
-        cards = [Card.from_line(line) for line in lines]
+    def parse(self) -> List[Card]:
+        return [Card.from_line(line) for line in self.lines]
+
+    def solve_part_1(self):
+        cards: List[Card] = self.parsed
         points = [card.calculate_points() for card in cards]
         return sum(points)
 
-    def solve_part_2(self, lines: List[str]):
-        cards = [Card.from_line(line) for line in lines]
-        number_of_copies = [1] * len(cards)
-        for i, card in enumerate(cards):
-            overlapping_numbers_count = card.count_overlapping_numbers()
-            for j in range(i+1, i+1+overlapping_numbers_count):
-                number_of_copies[j] += number_of_copies[i]
-        return sum(number_of_copies)
+    def solve_part_2(self):
+        cards: List[Card] = self.parsed
+        return sum(iter_copy_counts(card.count_overlapping_numbers() for card in cards))
+
+
+class ProblemSolverDay4Streaming(IProblemSolver):
+
+    def iter_match_counts(self) -> Iterator[int]:
+        for line in self.input.iter_lines():
+            yield Card.from_line(line).count_overlapping_numbers()
+
+    def solve_part_1(self):
+        return sum(1 << (match_count - 1) for match_count in self.iter_match_counts() if match_count > 0)
+
+    def solve_part_2(self):
+        return sum(iter_copy_counts(self.iter_match_counts()))
 
 
 if __name__ == '__main__':
     print(ProblemSolverDay4(use_smaller_input=True).solve())
     print(ProblemSolverDay4(use_smaller_input=False).solve())
+    print(ProblemSolverDay4Streaming(use_smaller_input=False).solve())
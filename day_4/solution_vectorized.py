@@ -0,0 +1,76 @@
+import numpy as np
+
+from day_4.solution import iter_copy_counts
+from general.grid import find_digit_runs
+from general.problem_solver_interface import IProblemSolver
+
+CARD_ID_TERMINATOR = ord(":")
+NUMBER_SEPARATOR = ord("|")
+DENSE_NUMBER_LIMIT = 1 << 12
+
+
+class CardTable:
+    # one row of packed bits per card: bit n is set when number n (or, for piles with large numbers, the n-th
+    # smallest number of the pile) is on the card
+    def __init__(self, winning_bits: np.ndarray, my_bits: np.ndarray):
+        self.winning_bits = winning_bits
+        self.my_bits = my_bits
+
+    def compute_match_counts(self) -> np.ndarray:
+        return np.bitwise_count(self.winning_bits & self.my_bits).sum(axis=1, dtype=np.int64)
+
+    def compute_total_points(self) -> int:
+        # the cards are bucketed by match count and only the buckets are summed, in python integers, so the points
+        # stay exact however many matches the cards have
+        cards_per_match_count = np.bincount(self.compute_match_counts()).tolist()
+        return sum(card_count << (match_count - 1)
+                   for match_count, card_count in enumerate(cards_per_match_count) if match_count > 0)
+
+    @staticmethod
+    def from_buffer(buffer) -> 'CardTable':
+        # every number is either a card id (followed by ":"), or one of that card's numbers, which are the winning
+        # numbers as long as the "|" of that card has not been passed yet
+        raw = np.frombuffer(buffer, dtype=np.uint8)
+        starts, ends, values = find_digit_runs(raw)
+        is_card = raw[np.minimum(ends, len(raw) - 1)] == CARD_ID_TERMINATOR
+        card_index = np.cumsum(is_card) - 1
+        separators_before = np.cumsum(raw == NUMBER_SEPARATOR)[starts]
+        is_number = ~is_card
+        is_mine = separators_before[is_number] > card_index[is_number]
+
+        # small numbers are their own bit position, larger ones are ranked first so the bitsets stay as wide as the
+        # number of distinct numbers
+        numbers = values[is_number]
+        if len(numbers) == 0 or numbers.max() < DENSE_NUMBER_LIMIT:
+            ranks, bit_count = numbers, int(numbers.max(initial=-1)) + 1
+        else:
+            distinct_numbers, ranks = np.unique(numbers, return_inverse=True)
+            bit_count = len(distinct_numbers)
+        card_of_number = card_index[is_number]
+        card_count = int(is_card.sum())
+        winning_flags = np.zeros((card_count, bit_count), dtype=bool)
+        my_flags = np.zeros((card_count, bit_count), dtype=bool)
+        winning_flags[card_of_number[~is_mine], ranks[~is_mine]] = True
+        my_flags[card_of_number[is_mine], ranks[is_mine]] = True
+        winning_bits = np.packbits(winning_flags, axis=1)
+        my_bits = np.packbits(my_flags, axis=1)
+        return CardTable(winning_bits=winning_bits, my_bits=my_bits)
+
+
+class ProblemSolverDay4Vectorized(IProblemSolver):
+
+    def parse(self) -> CardTable:
+        return CardTable.from_buffer(self.input.buffer())
+
+    def solve_part_1(self):
+        cards: CardTable = self.parsed
+        return cards.compute_total_points()
+
+    def solve_part_2(self):
+        cards: CardTable = self.parsed
+        return sum(iter_copy_counts(cards.compute_match_counts().tolist()))
+
+
+if __name__ == '__main__':
+    print(ProblemSolverDay4Vectorized(use_smaller_input=True).solve())
+    print(ProblemSolverDay4Vectorized(use_smaller_input=False).solve())
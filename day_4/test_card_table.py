@@ -0,0 +1,60 @@
+import random
+
+from day_4.solution import Card, iter_copy_counts
+from day_4.solution_vectorized import CardTable
+from general.input_generators import generate_day_4
+
+
+def test_match_counts_should_match_cards():
+    # arrange
+    text = generate_day_4(300, random.Random(4))
+    cards = [Card.from_line(line) for line in text.splitlines()]
+
+    # act
+    table = CardTable.from_buffer(text.encode())
+
+    # assert
+    assert table.compute_match_counts().tolist() == [card.count_overlapping_numbers() for card in cards]
+    assert table.compute_total_points() == sum(card.calculate_points() for card in cards)
+
+
+def test_large_numbers_should_be_ranked():
+    # arrange
+    text = "Card 1: 100000 5 | 5 100000 7\nCard 2: 3 | 4\n"
+
+    # act
+    table = CardTable.from_buffer(text.encode())
+
+    # assert
+    assert table.compute_match_counts().tolist() == [2, 0]
+    assert table.compute_total_points() == 2
+
+
+def test_total_points_should_not_overflow():
+    # arrange: each card is worth 2 ** 62 points on its own, but three of them do not fit in an int64
+    winning_numbers = " ".join(str(number) for number in range(1, 64))
+    my_numbers = " ".join(str(number) for number in range(1, 65))
+    lines = [f"Card {card_id}: {winning_numbers} | {my_numbers}" for card_id in range(1, 4)]
+    cards = [Card.from_line(line) for line in lines]
+
+    # act
+    table = CardTable.from_buffer("\n".join(lines).encode())
+
+    # assert
+    assert table.compute_total_points() == sum(card.calculate_points() for card in cards) == 3 * 2 ** 62
+
+
+def test_copy_counts_should_match_copying_every_card():
+    # arrange
+    rng = random.Random(20)
+    match_counts = [rng.choice([0, 0, 1, 2, 5]) for _ in range(200)] + [0] * 5
+    expected = [1] * len(match_counts)
+    for i, match_count in enumerate(match_counts):
+        for j in range(i + 1, i + 1 + match_count):
+            expected[j] += expected[i]
+
+    # act
+    copy_counts = list(iter_copy_counts(match_counts))
+
+    # assert
+    assert copy_counts == expected
@@ -0,0 +1,104 @@
+import argparse
+import json
+import random
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+from day_5.solution import ProblemSolverDay5, SortedRangeCollection
+from day_5.solution_part_2 import PiecewiseLinearMap, find_location_ranges, get_range_mappers, get_seed_ranges
+from general.benchmark import growth_exponent, summarize, time_call
+from general.input_generators import generate_day_5
+
+
+def layered_engine(seeds_part: str, mappers_part: str) -> Callable[[], int]:
+    seed_ranges, range_mappers = get_seed_ranges(seeds_part), get_range_mappers(mappers_part)
+    return lambda: find_location_ranges(seed_ranges, range_mappers)[0].start
+
+
+def composed_engine(seeds_part: str, mappers_part: str) -> Callable[[], int]:
+    seed_ranges, range_mappers = get_seed_ranges(seeds_part), get_range_mappers(mappers_part)
+    return lambda: PiecewiseLinearMap.compose(range_mappers).map_ranges(seed_ranges)[0].start
+
+
+def collections_engine(seeds_part: str, mappers_part: str) -> Callable[[], int]:
+    sd_mappers = ProblemSolverDay5.get_source_destination_mappers(mappers_part)
+    seed_range_collection = SortedRangeCollection()
+    for seed_range in ProblemSolverDay5.get_seed_ranges(seeds_part):
+        seed_range_collection.add_range(seed_range)
+    return lambda: ProblemSolverDay5.find_location_ranges(seed_range_collection, sd_mappers).ranges[0].start
+
+
+# every engine is set up from the almanac text first, so only the range mapping itself is timed
+ENGINES: Dict[str, Callable[[str, str], Callable[[], int]]] = {
+    "layered": layered_engine,
+    "composed": composed_engine,
+    "collections": collections_engine,
+}
+
+
+def run_range_scaling(interval_counts: List[int],
+                      layer_counts: List[int],
+                      repeat: int = 3,
+                      seed: int = 0,
+                      ) -> Dict[str, Any]:
+    runs: List[Dict[str, Any]] = []
+    for layer_count in layer_counts:
+        for interval_count in interval_counts:
+            almanac = generate_day_5(interval_count, random.Random(seed), layer_count=layer_count)
+            seeds_part, mappers_part = almanac.split("\n\n", 1)
+            answers = {}
+            timings = {}
+            for name, engine in ENGINES.items():
+                run_engine = engine(seeds_part, mappers_part)
+                engine_timings = []
+                for _ in range(repeat):
+                    elapsed, answers[name] = time_call(run_engine)
+                    engine_timings.append(elapsed)
+                timings[name] = summarize(engine_timings)
+            if len(set(answers.values())) != 1:
+                raise AssertionError(f"engines disagree on {interval_count} intervals, {layer_count} layers: {answers}")
+            runs.append({"intervals": interval_count, "layers": layer_count, "answer": answers["layered"],
+                         "engines": timings})
+
+    growth_exponents: Dict[str, Dict[str, Optional[float]]] = {name: {} for name in ENGINES}
+    for name in ENGINES:
+        for layer_count in layer_counts:
+            medians = [run["engines"][name]["median"] for run in runs if run["layers"] == layer_count]
+            growth_exponents[name][f"intervals@{layer_count}_layers"] = growth_exponent(interval_counts, medians)
+        for interval_count in interval_counts:
+            medians = [run["engines"][name]["median"] for run in runs if run["intervals"] == interval_count]
+            growth_exponents[name][f"layers@{interval_count}_intervals"] = growth_exponent(layer_counts, medians)
+    return {"seed": seed, "runs": runs, "growth_exponents": growth_exponents}
+
+
+def format_range_scaling(scaling: Dict[str, Any]) -> str:
+    rows = [f"{'layers':>8}{'intervals':>11}" + "".join(f"{name:>14}" for name in ENGINES)]
+    for run in scaling["runs"]:
+        rows.append(f"{run['layers']:>8}{run['intervals']:>11}"
+                    + "".join(f"{run['engines'][name]['median'] * 1000:>12.2f}ms" for name in ENGINES))
+    for name, exponents in scaling["growth_exponents"].items():
+        rows.append(f"{name}: " + ", ".join(f"{axis} {exponent:.2f}" for axis, exponent in exponents.items()
+                                            if exponent is not None))
+    return "\n".join(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Time the day 5 range engines on generated almanacs.")
+    parser.add_argument("--intervals", type=int, nargs="+", default=[50, 100, 200, 400],
+                        help="range lines per map block")
+    parser.add_argument("--layers", type=int, nargs="+", default=[2, 7, 14])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    scaling = run_range_scaling(args.intervals, args.layers, repeat=args.repeat, seed=args.seed)
+    print(format_range_scaling(scaling))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(scaling, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
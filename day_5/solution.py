@@ -1,7 +1,12 @@
-from typing import List, Iterator, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Iterator, Optional, Tuple
 
+from general.interval_set import IntervalSet
 from general.problem_solver_interface import IProblemSolver
-from general.utils import read_file
+
+if TYPE_CHECKING:
+    # numpy is only imported once a batch of seeds is looked up
+    import numpy as np
 
 
 class RangeMap:
@@ -68,35 +73,14 @@ class Range:
 
 class SortedRangeCollection:
     def __init__(self):
-        self.ranges: List[Range] = []
+        self.intervals = IntervalSet()
+
+    @property
+    def ranges(self) -> List[Range]:
+        return [Range(start, end) for start, end in self.intervals]
 
     def add_range(self, new_range: Range):
-        if len(self.ranges) == 0:
-            self.ranges.append(new_range)
-            return
-
-        i = 0
-        old_range = self.ranges[i]
-        while old_range.end < new_range.start:
-            if i == len(self.ranges) - 1:
-                self.ranges.append(new_range)
-                return
-            i += 1
-            old_range = self.ranges[i]
-
-        combined_range = old_range.try_combine_with(new_range)
-        if combined_range is None:
-            self.ranges.insert(i, new_range)
-            return
-
-        self.ranges[i] = combined_range
-        if i + 1 >= len(self.ranges):
-            return
-        next_range = self.ranges[i + 1]
-        next_combined_range = combined_range.try_combine_with(next_range)
-        if combined_range is not None:
-            self.ranges[i] = next_combined_range
-            self.ranges.remove(next_range)
+        self.intervals.add(new_range.start, new_range.end)
 
 
 class SourceDestinationMapper:
@@ -110,13 +94,42 @@ class SourceDestinationMapper:
                 return destination
         return source
 
+    @cached_property
+    def compiled_range_maps(self) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        # source starts (sorted), exclusive source ends and destination - source of every range map
+        import numpy as np
+        range_maps = sorted(self.range_maps, key=lambda range_map: range_map.source_range_start)
+        starts = np.array([range_map.source_range_start for range_map in range_maps], dtype=np.int64)
+        lengths = np.array([range_map.range_length for range_map in range_maps], dtype=np.int64)
+        destination_starts = np.array([range_map.destination_range_start for range_map in range_maps], dtype=np.int64)
+        return starts, starts + lengths, destination_starts - starts
+
+    def find_destinations(self, sources: 'np.ndarray') -> 'np.ndarray':
+        import numpy as np
+        starts, ends, deltas = self.compiled_range_maps
+        if len(starts) == 0:
+            return sources.copy()
+        # the only range map that can contain a source is the last one starting at or before it
+        candidate = np.maximum(np.searchsorted(starts, sources, side="right") - 1, 0)
+        is_mapped = (starts[candidate] <= sources) & (sources < ends[candidate])
+        return sources + np.where(is_mapped, deltas[candidate], 0)
+
     def find_destination_ranges(self, source_ranges: SortedRangeCollection):
+        # the parts of a source range not covered by any range map keep their numbers
+        range_maps = sorted(self.range_maps, key=lambda range_map: range_map.source_range_start)
         combined_destination_ranges = SortedRangeCollection()
         for source_range in source_ranges.ranges:
-            destination_ranges = [range_map.try_get_destination_range(source_range) for range_map in self.range_maps]
-            destination_ranges = [item for item in destination_ranges if item is not None]
-            for destination_range in destination_ranges:
+            uncovered_start = source_range.start
+            for range_map in range_maps:
+                destination_range = range_map.try_get_destination_range(source_range)
+                if destination_range is None:
+                    continue
+                if uncovered_start < range_map.source_range_start:
+                    combined_destination_ranges.add_range(Range(uncovered_start, range_map.source_range_start - 1))
                 combined_destination_ranges.add_range(destination_range)
+                uncovered_start = range_map.source_range_start + range_map.range_length
+            if uncovered_start <= source_range.end:
+                combined_destination_ranges.add_range(Range(uncovered_start, source_range.end))
         return combined_destination_ranges
 
     @staticmethod
@@ -127,23 +140,23 @@ class SourceDestinationMapper:
 
 class ProblemSolverDay5(IProblemSolver):
 
-    def solve_part_1(self):
-        input_str = read_file(self.input_file_name)
+    def parse(self) -> Tuple[str, List[SourceDestinationMapper]]:
+        input_str = self.input.text()
         seeds_part, mappers_part = input_str.split("\n\n", 1)
-        seeds = ProblemSolverDay5.get_seeds_part_1(seeds_part)
-        sd_mappers = ProblemSolverDay5.get_source_destination_mappers(mappers_part)
-        final_destinations: List[int] = [ProblemSolverDay5.find_location(seed, sd_mappers) for seed in seeds]
-        return min(final_destinations)
+        return seeds_part, ProblemSolverDay5.get_source_destination_mappers(mappers_part)
+
+    def solve_part_1(self):
+        import numpy as np
+        seeds_part, sd_mappers = self.parsed
+        seeds = np.array(ProblemSolverDay5.get_seeds_part_1(seeds_part), dtype=np.int64)
+        return int(ProblemSolverDay5.find_locations(seeds, sd_mappers).min())
 
     def solve_part_2(self):
-        return
-        input_str = read_file(self.input_file_name)
-        seeds_part, mappers_part = input_str.split("\n\n", 1)
+        seeds_part, sd_mappers = self.parsed
         seed_ranges = ProblemSolverDay5.get_seed_ranges(seeds_part)
         seed_range_collection = SortedRangeCollection()
         for seed_range in seed_ranges:
             seed_range_collection.add_range(seed_range)
-        sd_mappers = ProblemSolverDay5.get_source_destination_mappers(mappers_part)
         final_destination_ranges = ProblemSolverDay5.find_location_ranges(seed_range_collection, sd_mappers)
         return final_destination_ranges.ranges[0].start
 
@@ -161,6 +174,12 @@ class ProblemSolverDay5(IProblemSolver):
             seed = mapper.find_destination(seed)
         return seed
 
+    @staticmethod
+    def find_locations(seeds: 'np.ndarray', sd_mappers: List[SourceDestinationMapper]) -> 'np.ndarray':
+        for mapper in sd_mappers:
+            seeds = mapper.find_destinations(seeds)
+        return seeds
+
     @staticmethod
     def get_seeds_part_1(seeds_str: str) -> List[int]:
         numbers_part = seeds_str.split(": ")[1]
@@ -1,18 +1,19 @@
+from bisect import bisect_left, bisect_right
 from copy import copy
-from typing import List, Optional
-
-import attr
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterator, List, Optional, Tuple
 
 from day_5.solution import ProblemSolverDay5
+from general.interval_set import IntervalSet
 from general.problem_solver_interface import IProblemSolver
-from general.utils import read_file
 
-@attr.dataclass
+@dataclass
 class Range:
     start: int
     end: int
 
-    def __attrs_post_init__(self):
+    def __post_init__(self):
         # Ensure that start is less than or equal to end
         if self.start > self.end:
             raise ValueError("Start must be less than or equal to end")
@@ -50,39 +51,35 @@ class Range:
         return Range(self.start, self.end)
 
 
-@attr.dataclass
 class SortedRangeList:
-    sorted_ranges: List[Range]
+    # disjoint ranges sorted by start, backed by an IntervalSet so adding a range is a binary search. The ranges
+    # passed in are merged with one sort and sweep, so they need not be sorted or disjoint
+    def __init__(self, sorted_ranges: List[Range]):
+        self.intervals = IntervalSet.from_intervals((sorted_range.start, sorted_range.end)
+                                                    for sorted_range in sorted_ranges)
 
-    def add(self, range_to_add: Range):
+    @property
+    def sorted_ranges(self) -> List[Range]:
+        return [Range(start, end) for start, end in self.intervals]
 
-        first_possibly_overlapping_range = next((old_range for old_range in self.sorted_ranges
-                                                if old_range.end + 1 >= range_to_add.start), None)
-        if first_possibly_overlapping_range is None:
-            self.sorted_ranges.append(range_to_add)
-            return
-
-        possibly_overlapping_range = first_possibly_overlapping_range
-        index_possibly_overlapping_range = self.sorted_ranges.index(first_possibly_overlapping_range)
-        combined_range = possibly_overlapping_range.try_combine_with(range_to_add)
-        while combined_range is not None:
-            overlapping_range = self.sorted_ranges[index_possibly_overlapping_range]
-            self.sorted_ranges.remove(overlapping_range)
-            range_to_add = combined_range
-            if index_possibly_overlapping_range >= len(self.sorted_ranges):
-                break
-            possibly_overlapping_range = self.sorted_ranges[index_possibly_overlapping_range]
-            combined_range = possibly_overlapping_range.try_combine_with(range_to_add)
-        self.sorted_ranges.insert(index_possibly_overlapping_range, range_to_add)
+    def add(self, range_to_add: Range):
+        self.intervals.add(range_to_add.start, range_to_add.end)
 
     def __len__(self):
-        return len(self.sorted_ranges)
+        return len(self.intervals)
 
-    def __getitem__(self, index):
-        return self.sorted_ranges[index]
+    def __getitem__(self, index) -> Range:
+        return Range(*self.intervals[index])
 
+    def __eq__(self, other):
+        if not isinstance(other, SortedRangeList):
+            return NotImplemented
+        return self.intervals == other.intervals
 
-@attr.dataclass
+    def __repr__(self):
+        return f"SortedRangeList({self.sorted_ranges})"
+
+@dataclass
 class MapFunc:
     valid_input_range: Range
     delta: int
@@ -107,12 +104,12 @@ class MapFunc:
         )
 
 
-@attr.dataclass
+@dataclass
 class RangeMapper:
     sorted_map_funcs: List[MapFunc]
 
     def map(self, source_ranges: SortedRangeList):
-        destination_ranges = SortedRangeList([])
+        destination_ranges: List[Range] = []
 
         current_source_range_index = 0
         current_source_range = source_ranges[current_source_range_index]
@@ -123,17 +120,17 @@ class RangeMapper:
         while current_map_func_index < len(self.sorted_map_funcs):
             current_map_func = self.sorted_map_funcs[current_map_func_index]
             while remaining_source_range.end < current_map_func.valid_input_range.start:
-                destination_ranges.add(remaining_source_range)
+                destination_ranges.append(remaining_source_range)
                 current_source_range_index += 1
                 if current_source_range_index >= len(source_ranges):
-                    destination_ranges.add(remaining_source_range)
-                    return destination_ranges
+                    destination_ranges.append(remaining_source_range)
+                    return SortedRangeList(destination_ranges)
                 current_source_range = source_ranges[current_source_range_index]
                 remaining_source_range = copy(current_source_range)
             if remaining_source_range.start < current_map_func.valid_input_range.start:
                 unmappable_range_part = \
                     Range(start=remaining_source_range.start, end=current_map_func.valid_input_range.start-1)
-                destination_ranges.add(unmappable_range_part)
+                destination_ranges.append(unmappable_range_part)
                 remaining_source_range = Range(
                     start=unmappable_range_part.end+1,
                     end=remaining_source_range.end,
@@ -142,12 +139,12 @@ class RangeMapper:
                 current_map_func.valid_input_range.end >= remaining_source_range.start \
                 and remaining_source_range.end >= current_map_func.valid_input_range.start
             if remaining_source_range_overlaps_with_current_func_map:
-                destination_ranges.add(current_map_func.map(remaining_source_range))
+                destination_ranges.append(current_map_func.map(remaining_source_range))
                 remaining_source_range = remaining_source_range.without(current_map_func.valid_input_range)
                 if remaining_source_range is None:
                     current_source_range_index += 1
                     if current_source_range_index >= len(source_ranges):
-                        return destination_ranges
+                        return SortedRangeList(destination_ranges)
                     current_source_range = source_ranges[current_source_range_index]
                     remaining_source_range = copy(current_source_range)
                     continue
@@ -158,13 +155,13 @@ class RangeMapper:
                         end=remaining_source_range.end
                     )
             current_map_func_index += 1
-        destination_ranges.add(remaining_source_range)
+        destination_ranges.append(remaining_source_range)
         current_source_range_index += 1
         while current_source_range_index < len(source_ranges):
             current_source_range = source_ranges[current_source_range_index]
-            destination_ranges.add(current_source_range)
+            destination_ranges.append(current_source_range)
             current_source_range_index += 1
-        return destination_ranges
+        return SortedRangeList(destination_ranges)
 
     @staticmethod
     def from_lines(lines: List[str]) -> 'RangeMapper':
@@ -174,14 +171,138 @@ class RangeMapper:
         return RangeMapper(sorted_func_maps)
 
 
+@dataclass
+class PiecewiseLinearMap:
+    # Number x maps to x + deltas[i] for the last breakpoints[i] <= x, and to x itself below the first breakpoint.
+    # Consecutive segments always have different deltas
+    breakpoints: List[int]
+    deltas: List[int]
+
+    def delta_at(self, number: int) -> int:
+        index = bisect_right(self.breakpoints, number) - 1
+        return self.deltas[index] if index >= 0 else 0
+
+    def map(self, number: int) -> int:
+        return number + self.delta_at(number)
+
+    def map_range(self, source_range: Range) -> Iterator[Range]:
+        index = bisect_right(self.breakpoints, source_range.start) - 1
+        start = source_range.start
+        while start <= source_range.end:
+            end = source_range.end
+            if index + 1 < len(self.breakpoints):
+                end = min(end, self.breakpoints[index + 1] - 1)
+            delta = self.deltas[index] if index >= 0 else 0
+            yield Range(start + delta, end + delta)
+            start = end + 1
+            index += 1
+
+    def map_ranges(self, source_ranges: SortedRangeList) -> SortedRangeList:
+        destination_ranges: List[Range] = []
+        for source_range in source_ranges.sorted_ranges:
+            destination_ranges.extend(self.map_range(source_range))
+        return SortedRangeList(destination_ranges)
+
+    def then(self, other: 'PiecewiseLinearMap') -> 'PiecewiseLinearMap':
+        # x -> other.map(self.map(x)): every segment of self is split at the breakpoints of other inside its image
+        breakpoints: List[int] = []
+        deltas: List[int] = []
+        for index in range(-1, len(self.breakpoints)):
+            delta = self.deltas[index] if index >= 0 else 0
+            first = 0
+            last = len(other.breakpoints)
+            segment_starts: List[int] = []
+            if index >= 0:
+                segment_starts.append(self.breakpoints[index])
+                first = bisect_right(other.breakpoints, self.breakpoints[index] + delta)
+            if index + 1 < len(self.breakpoints):
+                last = bisect_left(other.breakpoints, self.breakpoints[index + 1] + delta)
+            segment_starts.extend(breakpoint - delta for breakpoint in other.breakpoints[first:last])
+            for segment_start in segment_starts:
+                PiecewiseLinearMap._append_segment(
+                    breakpoints, deltas, segment_start, delta + other.delta_at(segment_start + delta))
+        return PiecewiseLinearMap(breakpoints, deltas)
+
+    @staticmethod
+    def _append_segment(breakpoints: List[int], deltas: List[int], start: int, delta: int):
+        previous_delta = deltas[-1] if deltas else 0
+        if delta == previous_delta:
+            return
+        if breakpoints and breakpoints[-1] == start:
+            breakpoints.pop()
+            deltas.pop()
+            if delta == (deltas[-1] if deltas else 0):
+                return
+        breakpoints.append(start)
+        deltas.append(delta)
+
+    @staticmethod
+    def from_range_mapper(range_mapper: RangeMapper) -> 'PiecewiseLinearMap':
+        breakpoints: List[int] = []
+        deltas: List[int] = []
+        for map_func in range_mapper.sorted_map_funcs:
+            input_range = map_func.valid_input_range
+            PiecewiseLinearMap._append_segment(breakpoints, deltas, input_range.start, map_func.delta)
+            PiecewiseLinearMap._append_segment(breakpoints, deltas, input_range.end + 1, 0)
+        return PiecewiseLinearMap(breakpoints, deltas)
+
+    @staticmethod
+    def compose(range_mappers: List[RangeMapper]) -> 'PiecewiseLinearMap':
+        composed_map = PiecewiseLinearMap([], [])
+        for range_mapper in range_mappers:
+            composed_map = composed_map.then(PiecewiseLinearMap.from_range_mapper(range_mapper))
+        return composed_map
+
+
+class RangePipeline:
+    # Keeps the ranges coming out of every layer. Replacing a layer only drops the outputs of that layer and the ones
+    # after it, so what-if questions about one map block do not redo the layers before it.
+    # The memoized range lists are shared with branches and must not be modified
+    def __init__(self, seed_ranges: SortedRangeList, range_mappers: List[RangeMapper]):
+        self.seed_ranges = seed_ranges
+        self.range_mappers = list(range_mappers)
+        self._layer_outputs: List[SortedRangeList] = []
+
+    def layer_output(self, index: int) -> SortedRangeList:
+        while len(self._layer_outputs) <= index:
+            source_ranges = self._layer_outputs[-1] if self._layer_outputs else self.seed_ranges
+            self._layer_outputs.append(self.range_mappers[len(self._layer_outputs)].map(source_ranges))
+        return self._layer_outputs[index]
+
+    def location_ranges(self) -> SortedRangeList:
+        if not self.range_mappers:
+            return self.seed_ranges
+        return self.layer_output(len(self.range_mappers) - 1)
+
+    def lowest_location(self) -> int:
+        return self.location_ranges()[0].start
+
+    def replace_layer(self, index: int, range_mapper: RangeMapper):
+        self.range_mappers[index] = range_mapper
+        del self._layer_outputs[index:]
+
+    def with_layer(self, index: int, range_mapper: RangeMapper) -> 'RangePipeline':
+        # a copy with one layer replaced, reusing (and first computing) the outputs of the layers before it
+        if index > 0:
+            self.layer_output(index - 1)
+        branch = RangePipeline(self.seed_ranges, self.range_mappers)
+        branch._layer_outputs = self._layer_outputs[:index]
+        branch.replace_layer(index, range_mapper)
+        return branch
+
+    def lowest_locations_with_layers(self, edits: List[Tuple[int, RangeMapper]]) -> List[int]:
+        # every edit is applied on its own to the current layers, not on top of the edits before it
+        return [self.with_layer(index, range_mapper).lowest_location() for index, range_mapper in edits]
+
+
 def get_seed_ranges(seeds_str: str) -> SortedRangeList:
     numbers = ProblemSolverDay5.get_seeds_part_1(seeds_str)
-    seed_ranges = SortedRangeList([])
+    seed_ranges: List[Range] = []
     for i in range(0, len(numbers), 2):
         start = numbers[i]
         length = numbers[i + 1]
-        seed_ranges.add(Range(start, start + length - 1))
-    return seed_ranges
+        seed_ranges.append(Range(start, start + length - 1))
+    return SortedRangeList(seed_ranges)
 
 
 def get_source_destination_mappers(mappers_part: str) -> List[RangeMapper]:
@@ -210,16 +331,30 @@ def get_range_mappers(mappers_part: str):
 
 class ProblemSolver(IProblemSolver):
 
+    def parse(self) -> Tuple[List[int], SortedRangeList, List[RangeMapper]]:
+        input_str = self.input.text()
+        seeds_part, mappers_part = input_str.split("\n\n", 1)
+        seeds = ProblemSolverDay5.get_seeds_part_1(seeds_part)
+        return seeds, get_seed_ranges(seeds_part), get_range_mappers(mappers_part)
+
+    @cached_property
+    def composed_map(self) -> PiecewiseLinearMap:
+        # seed to location in one map, worth keeping in the result cache for repeated queries on the same almanac
+        _, _, range_mappers = self.parsed
+        return self._cached("composed_map", lambda: PiecewiseLinearMap.compose(range_mappers))
+
+    @cached_property
+    def pipeline(self) -> RangePipeline:
+        _, seed_ranges, range_mappers = self.parsed
+        return RangePipeline(seed_ranges, range_mappers)
+
     def solve_part_1(self):
-        pass
+        seeds, _, _ = self.parsed
+        return min(self.composed_map.map(seed) for seed in seeds)
 
     def solve_part_2(self):
-        input_str = read_file(self.input_file_name)
-        seeds_part, mappers_part = input_str.split("\n\n", 1)
-        seed_ranges = get_seed_ranges(seeds_part)
-        range_mappers = get_range_mappers(mappers_part)
-        final_destination_ranges = find_location_ranges(seed_ranges, range_mappers)
-        return final_destination_ranges.sorted_ranges[0].start
+        _, seed_ranges, _ = self.parsed
+        return self.composed_map.map_ranges(seed_ranges)[0].start
 
 
 if __name__ == '__main__':
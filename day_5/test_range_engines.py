@@ -0,0 +1,140 @@
+import random
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from day_5.solution import ProblemSolverDay5, RangeMap, SortedRangeCollection, SourceDestinationMapper
+from day_5.solution import Range as CollectionRange
+from day_5.solution_part_2 import (MapFunc, PiecewiseLinearMap, Range, RangeMapper, RangePipeline, SortedRangeList,
+                                   find_location_ranges)
+
+# (destination start, source start, length) per range line, one list per layer
+Almanac = List[List[Tuple[int, int, int]]]
+
+DOMAIN = 120
+
+
+def random_almanac(rng: random.Random, layer_count: int, map_count: int) -> Almanac:
+    # disjoint source ranges with gaps between them, sent anywhere in the domain
+    almanac: Almanac = []
+    for _ in range(layer_count):
+        cut_points = sorted(rng.sample(range(1, DOMAIN), 2 * map_count))
+        layer = []
+        for source_start, source_end in zip(cut_points[::2], cut_points[1::2]):
+            length = source_end - source_start
+            layer.append((rng.randrange(DOMAIN - length), source_start, length))
+        rng.shuffle(layer)
+        almanac.append(layer)
+    return almanac
+
+
+def random_seed_ranges(rng: random.Random, count: int) -> List[Tuple[int, int]]:
+    seed_ranges = []
+    for _ in range(count):
+        start = rng.randrange(DOMAIN)
+        seed_ranges.append((start, rng.randint(start, min(DOMAIN - 1, start + 30))))
+    return seed_ranges
+
+
+def oracle(almanac: Almanac, number: int) -> int:
+    for layer in almanac:
+        for destination_start, source_start, length in layer:
+            if source_start <= number < source_start + length:
+                number += destination_start - source_start
+                break
+    return number
+
+
+def to_range_mappers(almanac: Almanac) -> List[RangeMapper]:
+    return [RangeMapper.from_lines(["map:"] + [f"{dst} {src} {length}" for dst, src, length in layer])
+            for layer in almanac]
+
+
+def to_source_destination_mappers(almanac: Almanac) -> List[SourceDestinationMapper]:
+    return [SourceDestinationMapper([RangeMap(dst, src, length) for dst, src, length in layer]) for layer in almanac]
+
+
+def covered_points(ranges) -> List[int]:
+    return sorted({number for covered_range in ranges for number in range(covered_range.start, covered_range.end + 1)})
+
+
+SIZES = [(1, 1), (2, 3), (4, 8), (7, 20)]
+
+
+@pytest.mark.parametrize("layer_count, map_count", SIZES)
+@pytest.mark.parametrize("seed", range(5))
+def test_range_engines_should_match_oracle(layer_count, map_count, seed):
+    # arrange
+    rng = random.Random(seed * 1000 + layer_count * 100 + map_count)
+    almanac = random_almanac(rng, layer_count, map_count)
+    seed_ranges = random_seed_ranges(rng, rng.randint(1, 6))
+    expected = sorted({oracle(almanac, number) for start, end in seed_ranges for number in range(start, end + 1)})
+    range_mappers = to_range_mappers(almanac)
+    sd_mappers = to_source_destination_mappers(almanac)
+
+    # act
+    layered = find_location_ranges(SortedRangeList([Range(start, end) for start, end in seed_ranges]), range_mappers)
+    composed = PiecewiseLinearMap.compose(range_mappers).map_ranges(
+        SortedRangeList([Range(start, end) for start, end in seed_ranges]))
+    seed_range_collection = SortedRangeCollection()
+    for start, end in seed_ranges:
+        seed_range_collection.add_range(CollectionRange(start, end))
+    collections = ProblemSolverDay5.find_location_ranges(seed_range_collection, sd_mappers)
+
+    # assert
+    assert covered_points(layered.sorted_ranges) == expected
+    assert covered_points(composed.sorted_ranges) == expected
+    assert covered_points(collections.ranges) == expected
+
+
+@pytest.mark.parametrize("layer_count, map_count", SIZES)
+@pytest.mark.parametrize("seed", range(5))
+def test_point_engines_should_match_oracle(layer_count, map_count, seed):
+    # arrange
+    almanac = random_almanac(random.Random(seed), layer_count, map_count)
+    numbers = list(range(-5, DOMAIN + 5))
+    expected = [oracle(almanac, number) for number in numbers]
+
+    # act
+    composed_map = PiecewiseLinearMap.compose(to_range_mappers(almanac))
+    vectorized = ProblemSolverDay5.find_locations(np.array(numbers, dtype=np.int64),
+                                                  to_source_destination_mappers(almanac))
+
+    # assert
+    assert [composed_map.map(number) for number in numbers] == expected
+    assert vectorized.tolist() == expected
+
+
+def test_layer_with_single_map_func_should_keep_unmapped_parts():
+    # arrange
+    range_mapper = RangeMapper([MapFunc(Range(10, 19), delta=100)])
+
+    # act
+    result = range_mapper.map(SortedRangeList([Range(0, 30)]))
+
+    # assert
+    assert result == SortedRangeList([Range(0, 9), Range(20, 30), Range(110, 119)])
+
+
+def test_pipeline_should_only_recompute_from_replaced_layer():
+    # arrange
+    rng = random.Random(25)
+    almanac = random_almanac(rng, 7, 8)
+    seed_ranges = SortedRangeList([Range(start, end) for start, end in random_seed_ranges(rng, 4)])
+    pipeline = RangePipeline(seed_ranges, to_range_mappers(almanac))
+    pipeline.lowest_location()
+    first_layers = [pipeline.layer_output(index) for index in range(4)]
+    edits = [(index, to_range_mappers(random_almanac(rng, 1, 5))[0]) for index in range(7)]
+
+    # act
+    lowest_locations = pipeline.lowest_locations_with_layers(edits)
+    pipeline.replace_layer(*edits[4])
+
+    # assert
+    for (index, range_mapper), lowest_location in zip(edits, lowest_locations):
+        range_mappers = to_range_mappers(almanac)
+        range_mappers[index] = range_mapper
+        assert lowest_location == find_location_ranges(seed_ranges, range_mappers)[0].start
+    assert pipeline.lowest_location() == lowest_locations[4]
+    assert all(pipeline.layer_output(index) is first_layers[index] for index in range(4))
@@ -1,19 +1,17 @@
 import math
 from enum import StrEnum
-from typing import List, Dict, Callable
-
-import attr
+from dataclasses import dataclass
+from typing import List, Dict, Callable, Tuple
 
 from general.problem_solver_interface import IProblemSolver
 
-@attr.dataclass
+@dataclass
 class Node:
     name: str
     left: str
     right: str
 
 
-@attr.dataclass
 class Graph(Dict[str, Node]):
     pass
 
@@ -23,7 +21,7 @@ class Direction(StrEnum):
     Right = "R"
 
 
-@attr.dataclass
+@dataclass
 class DirectionIterator:
     _left_right_instructions: str
     _current_index: int = 0
@@ -38,13 +36,12 @@ class DirectionIterator:
 
 def process_input(lines: List[str]):
     left_right_instructions = lines[0]
-    direction_iterator = DirectionIterator(left_right_instructions)
     graph = Graph()
     for line in lines[2:]:
         node_name, left_right_part = line.split(" = ")  # type: str
         left, right = left_right_part.strip("()").split(", ")
         graph[node_name] = Node(name=node_name, left=left, right=right)
-    return direction_iterator, graph
+    return left_right_instructions, graph
 
 
 def is_zzz(string: str):
@@ -58,8 +55,12 @@ def ends_with_z(string: str):
 
 
 class ProblemSolver(IProblemSolver):
+    def parse(self) -> Tuple[str, Graph]:
+        return process_input(self.lines)
+
     def solve_part_1(self, start_node_name="AAA", is_destination_func: Callable[[str], bool] = is_zzz):
-        direction_iterator, graph = process_input(self.lines)
+        left_right_instructions, graph = self.parsed
+        direction_iterator = DirectionIterator(left_right_instructions)
         current_node = graph.get(start_node_name)
         next_direction = direction_iterator.next()
         steps = 0
@@ -74,7 +75,7 @@ class ProblemSolver(IProblemSolver):
         return steps
 
     def solve_part_2(self):
-        direction_iterator, graph = process_input(self.lines)
+        _, graph = self.parsed
         start_nodes = [node for node in graph.values() if node.name.endswith("A")]
         required_steps = [self.solve_part_1(start_node_name=node.name, is_destination_func=ends_with_z)
                           for node in start_nodes]
@@ -0,0 +1,114 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from general.benchmark import to_jsonable
+from general.problem_solver_interface import IProblemSolver
+from general.runner import _init_worker, create_cache
+from general.solver_discovery import SolverSpec, discover_solvers
+
+_worker_solver_class: Optional[Type[IProblemSolver]] = None
+_worker_use_cache = False
+
+
+def resolve_input_files(directory_or_pattern: str) -> List[str]:
+    if os.path.isdir(directory_or_pattern):
+        return sorted(glob.glob(os.path.join(directory_or_pattern, "*.txt")))
+    return sorted(glob.glob(directory_or_pattern))
+
+
+def solve_file(solver_class: Type[IProblemSolver], input_file_name: str, use_cache: bool = False) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result: Dict[str, Any] = {
+        "solver": f"{solver_class.__module__}.{solver_class.__name__}",
+        "input_file_name": input_file_name,
+        "errors": {},
+    }
+    with contextlib.redirect_stdout(io.StringIO()):
+        # every failure is recorded in the result, so one bad input file does not end the whole batch
+        try:
+            solver = solver_class(input_file_name=input_file_name, cache=create_cache(use_cache))
+        except Exception as e:
+            result["errors"]["init"] = repr(e)
+        else:
+            for part in (1, 2):
+                try:
+                    result[f"part_{part}"] = to_jsonable(solver.run_part(part))
+                except Exception as e:
+                    result["errors"][f"part_{part}"] = repr(e)
+            # the parsed data may hold views into a mapped buffer, so it is dropped before the buffer is closed
+            input_source = solver.input
+            del solver
+            try:
+                input_source.close()
+            except Exception as e:
+                result["errors"]["close"] = repr(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _init_batch_worker(spec: SolverSpec, use_cache: bool):
+    global _worker_solver_class, _worker_use_cache
+    _init_worker()
+    _worker_solver_class = spec.load_class()
+    _worker_use_cache = use_cache
+
+
+def _solve_file_in_worker(input_file_name: str) -> Dict[str, Any]:
+    return solve_file(_worker_solver_class, input_file_name, _worker_use_cache)
+
+
+def run_batch(spec: SolverSpec,
+              input_file_names: List[str],
+              workers: int = 1,
+              use_cache: bool = False,
+              ) -> Iterator[Dict[str, Any]]:
+    # the solver module is imported once per process, so module and class level tables are built only once
+    if workers <= 1:
+        solver_class = spec.load_class()
+        for input_file_name in input_file_names:
+            yield solve_file(solver_class, input_file_name, use_cache)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=context,
+                             initializer=_init_batch_worker,
+                             initargs=(spec, use_cache),
+                             ) as executor:
+        chunk_size = max(1, len(input_file_names) // (4 * workers))
+        yield from executor.map(_solve_file_in_worker, input_file_names, chunksize=chunk_size)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Solve many input files of one day, one JSON line per file.")
+    parser.add_argument("day", help="e.g. day_4")
+    parser.add_argument("inputs", nargs="+", help="input files, directories of *.txt inputs or glob patterns")
+    parser.add_argument("--solver", help="class or module.class name, when the day has several solvers")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not fill the on-disk result cache")
+    args = parser.parse_args(argv)
+
+    specs = discover_solvers(days=[args.day])
+    if args.solver:
+        specs = [spec for spec in specs if args.solver in (spec.class_name, spec.name)]
+    if not specs:
+        parser.error(f"no solver found for {args.day}")
+    input_file_names = [input_file_name for directory_or_pattern in args.inputs
+                        for input_file_name in resolve_input_files(directory_or_pattern)]
+    for spec in specs:
+        for result in run_batch(spec, input_file_names, workers=args.workers, use_cache=not args.no_cache):
+            print(json.dumps(result), flush=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,282 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from general.input_generators import write_input
+from general.solver_discovery import REPO_ROOT, SolverSpec, discover_solvers
+
+PHASES = ("load", "part_1", "part_2")
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_MIN_DELTA_SECONDS = 0.001
+HEAVIEST_IMPORTS_REPORTED = 5
+
+
+def to_jsonable(value: Any) -> Any:
+    # numpy scalars (day 14, day 17) are not json serializable
+    if hasattr(value, "item"):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def time_call(func: Callable[[], Any]) -> Tuple[float, Any]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func()
+        end = time.perf_counter()
+    return end - start, result
+
+
+def summarize(timings: List[float]) -> Dict[str, Any]:
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "runs": timings,
+    }
+
+
+def benchmark_solver(spec: SolverSpec,
+                     repeat: int = 5,
+                     warmup: int = 1,
+                     input_file_name: Optional[str] = None,
+                     ) -> Dict[str, Any]:
+    if input_file_name is None:
+        input_file_name = spec.input_file()
+    timings: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    answers: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    def load():
+        solver = spec.create(input_file_name)
+        solver.parsed
+        return solver
+
+    for iteration in range(warmup + repeat):
+        is_warmup = iteration < warmup
+        duration, solver = time_call(load)
+        if not is_warmup:
+            timings["load"].append(duration)
+        for phase, solve_part in (("part_1", solver.solve_part_1), ("part_2", solver.solve_part_2)):
+            if phase in errors:
+                continue
+            try:
+                duration, answer = time_call(solve_part)
+            except Exception as e:
+                errors[phase] = repr(e)
+                continue
+            answers[phase] = to_jsonable(answer)
+            if not is_warmup:
+                timings[phase].append(duration)
+
+    return {
+        "input_file_name": input_file_name,
+        "phases": {phase: summarize(runs) for phase, runs in timings.items() if runs},
+        "answers": answers,
+        "errors": errors,
+    }
+
+
+def measure_import_time(module_name: str) -> Dict[str, Any]:
+    # a fresh interpreter per module, otherwise everything after the first import is already cached
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    # children are printed before their parent, indented by two more spaces per nesting level
+    module_microseconds = 0
+    direct_imports: List[Tuple[str, int]] = []
+    pending_direct_imports: List[Tuple[str, int]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        name = name.rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            pending_direct_imports.append((name.strip(), int(cumulative)))
+        elif depth == 0:
+            if name.strip() == module_name:
+                module_microseconds = int(cumulative)
+                direct_imports = pending_direct_imports
+            pending_direct_imports = []
+    heaviest = sorted(direct_imports, key=lambda item: item[1], reverse=True)[:HEAVIEST_IMPORTS_REPORTED]
+    return {
+        "seconds": module_microseconds / 1_000_000,
+        "heaviest": [{"module": name, "seconds": microseconds / 1_000_000} for name, microseconds in heaviest],
+    }
+
+
+def run_benchmarks(specs: List[SolverSpec],
+                   repeat: int = 5,
+                   warmup: int = 1,
+                   use_smaller_input: bool = False,
+                   ) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for spec in specs:
+        input_file_name = spec.input_file(use_smaller_input)
+        if not os.path.exists(input_file_name):
+            continue
+        results[spec.name] = benchmark_solver(spec, repeat=repeat, warmup=warmup, input_file_name=input_file_name)
+    module_names = list(dict.fromkeys(spec.module_name for spec in specs))
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "solvers": results,
+        "imports": {module_name: measure_import_time(module_name) for module_name in module_names},
+    }
+
+
+def growth_exponent(sizes: List[int], medians: List[float]) -> Optional[float]:
+    # slope of log(runtime) against log(size): ~1 is linear, ~2 is quadratic
+    if len(sizes) < 2 or medians[0] <= 0 or medians[-1] <= 0:
+        return None
+    return math.log(medians[-1] / medians[0]) / math.log(sizes[-1] / sizes[0])
+
+
+def run_scaling(day: str,
+                sizes: List[int],
+                repeat: int = 3,
+                warmup: int = 0,
+                seed: int = 0,
+                ) -> Dict[str, Any]:
+    specs = discover_solvers(days=[day])
+    results: Dict[str, Any] = {spec.name: {"sizes": [], "runs": []} for spec in specs}
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            input_file_name = os.path.join(directory, f"{day}_{size}.txt")
+            write_input(input_file_name, day, size, seed)
+            for spec in specs:
+                results[spec.name]["sizes"].append(size)
+                results[spec.name]["runs"].append(
+                    benchmark_solver(spec, repeat=repeat, warmup=warmup, input_file_name=input_file_name))
+    for solver_result in results.values():
+        solver_result["growth_exponents"] = {}
+        for phase in PHASES:
+            medians = [run["phases"][phase]["median"] for run in solver_result["runs"] if phase in run["phases"]]
+            if len(medians) == len(sizes):
+                solver_result["growth_exponents"][phase] = growth_exponent(sizes, medians)
+    return {"day": day, "seed": seed, "solvers": results}
+
+
+def format_scaling(scaling: Dict[str, Any]) -> str:
+    rows = [f"  {'size':>10}" + "".join(f"{phase:>12}" for phase in PHASES)]
+    for solver_name, solver_result in scaling["solvers"].items():
+        rows.append(solver_name)
+        for size, run in zip(solver_result["sizes"], solver_result["runs"]):
+            cells = "".join(f"{run['phases'][phase]['median'] * 1000:>10.2f}ms" if phase in run["phases"]
+                            else f"{'error':>12}" for phase in PHASES)
+            rows.append(f"  {size:>10}{cells}")
+        exponents = solver_result["growth_exponents"]
+        rows.append(f"  {'exponent':>10}" + "".join(
+            f"{exponents[phase]:>12.2f}" if exponents.get(phase) is not None else f"{'-':>12}" for phase in PHASES))
+    return "\n".join(rows)
+
+
+def compare(current: Dict[str, Any],
+            baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD,
+            min_delta_seconds: float = DEFAULT_MIN_DELTA_SECONDS,
+            ) -> List[Dict[str, Any]]:
+    # a phase regresses when its median is both relatively and absolutely slower than the baseline
+    regressions: List[Dict[str, Any]] = []
+    for solver_name, solver_result in current["solvers"].items():
+        baseline_result = baseline["solvers"].get(solver_name)
+        if baseline_result is None:
+            continue
+        for phase, stats in solver_result["phases"].items():
+            baseline_stats = baseline_result["phases"].get(phase)
+            if baseline_stats is None:
+                continue
+            median, baseline_median = stats["median"], baseline_stats["median"]
+            if median - baseline_median < min_delta_seconds:
+                continue
+            ratio = median / baseline_median if baseline_median > 0 else float("inf")
+            if ratio > 1 + threshold:
+                regressions.append({
+                    "solver": solver_name,
+                    "phase": phase,
+                    "baseline_median": baseline_median,
+                    "median": median,
+                    "ratio": ratio,
+                })
+    return regressions
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    rows = [f"{'solver':<45}" + "".join(f"{phase:>12}" for phase in PHASES)]
+    for solver_name, solver_result in results["solvers"].items():
+        row = f"{solver_name:<45}"
+        for phase in PHASES:
+            stats = solver_result["phases"].get(phase)
+            cell = f"{stats['median'] * 1000:.2f}ms" if stats is not None else "error"
+            row += f"{cell:>12}"
+        rows.append(row)
+    rows.append("")
+    rows.append(f"{'module':<45}{'import':>12}  heaviest imports")
+    for module_name, import_time in results.get("imports", {}).items():
+        heaviest = ", ".join(f"{item['module']} {item['seconds'] * 1000:.1f}ms" for item in import_time["heaviest"])
+        rows.append(f"{module_name:<45}{import_time['seconds'] * 1000:>10.1f}ms  {heaviest}")
+    return "\n".join(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark every day_* solver.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--day", action="append", dest="days", help="only run e.g. day_5 (repeatable)")
+    parser.add_argument("--smaller-input", action="store_true")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--scaling", metavar="DAY", help="time DAY on generated inputs of increasing --sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 200, 400, 800])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.scaling:
+        scaling = run_scaling(args.scaling, args.sizes, repeat=args.repeat, warmup=args.warmup, seed=args.seed)
+        print(format_scaling(scaling))
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(scaling, file, indent=2)
+        return 0
+
+    specs = discover_solvers(days=args.days)
+    results = run_benchmarks(specs, repeat=args.repeat, warmup=args.warmup, use_smaller_input=args.smaller_input)
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, threshold=args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['solver']} {regression['phase']}: "
+                  f"{regression['baseline_median'] * 1000:.2f}ms -> {regression['median'] * 1000:.2f}ms "
+                  f"({regression['ratio']:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import types
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = "AOC_CACHE_DIR"
+CACHE_DISABLED_ENVIRONMENT_VARIABLE = "AOC_NO_CACHE"
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "aoc2023")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def cache_disabled_by_environment() -> bool:
+    return os.environ.get(CACHE_DISABLED_ENVIRONMENT_VARIABLE, "").lower() not in ("", "0", "false", "no")
+
+
+def _is_repo_module(module: Optional[types.ModuleType]) -> bool:
+    file_name = getattr(module, "__file__", None)
+    return file_name is not None and os.path.abspath(file_name).startswith(REPO_ROOT + os.sep)
+
+
+def repo_dependencies(solver_class: type) -> List[str]:
+    # the repo modules of the solver class and its bases, plus every repo module reachable from them through their
+    # globals: imported modules as well as the classes and functions imported from them
+    pending = [base.__module__ for base in solver_class.__mro__]
+    dependencies: Set[str] = set()
+    while pending:
+        module_name = pending.pop()
+        module = sys.modules.get(module_name)
+        if module_name in dependencies or not _is_repo_module(module):
+            continue
+        dependencies.add(module_name)
+        for value in vars(module).values():
+            if isinstance(value, types.ModuleType):
+                pending.append(value.__name__)
+            elif isinstance(getattr(value, "__module__", None), str):
+                pending.append(value.__module__)
+    return sorted(dependencies)
+
+
+class ResultCache:
+    def __init__(self,
+                 directory: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 ):
+        if directory is None:
+            directory = os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE, DEFAULT_CACHE_DIRECTORY)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._source_digests: Dict[str, str] = {}
+        self._dependency_digests: Dict[type, str] = {}
+        self._total_bytes: Optional[int] = None
+
+    def source_digest(self, module_name: str) -> str:
+        if module_name not in self._source_digests:
+            with open(sys.modules[module_name].__file__, "rb") as file:
+                self._source_digests[module_name] = hashlib.sha256(file.read()).hexdigest()
+        return self._source_digests[module_name]
+
+    def dependency_digest(self, solver_class: type) -> str:
+        if solver_class not in self._dependency_digests:
+            digests = [f"{module_name}={self.source_digest(module_name)}"
+                       for module_name in repo_dependencies(solver_class)]
+            self._dependency_digests[solver_class] = hashlib.sha256(",".join(digests).encode()).hexdigest()
+        return self._dependency_digests[solver_class]
+
+    def key(self, solver, kind: str) -> str:
+        # a changed input file, an edited solver module or an edited repo module it depends on all lead to a new key
+        solver_class = type(solver)
+        key_parts = [
+            kind,
+            f"{solver_class.__module__}.{solver_class.__qualname__}",
+            self.dependency_digest(solver_class),
+            solver.input.digest(),
+        ]
+        return hashlib.sha256(":".join(key_parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pickle")
+
+    def get(self, key: str) -> Tuple[Any, bool]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # a missing or truncated file, or a pickled class that was renamed or moved since, is a miss
+            return None, False
+        os.utime(path)
+        return value, True
+
+    def put(self, key: str, value: Any):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced_bytes = os.path.getsize(path) if os.path.exists(path) else 0
+        # write to a temporary file first, so concurrent readers never see a partial pickle
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            written_bytes = file.tell()
+        os.replace(temporary_path, path)
+
+        # the cache is only walked once per instance and whenever the running total passes max_bytes. Writes of
+        # other processes are not counted until then, so the limit is approximate
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        else:
+            self._total_bytes += written_bytes - replaced_bytes
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries: List[Tuple[float, int, str]] = []
+        for directory_path, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                if not file_name.endswith(".pickle"):
+                    continue
+                path = os.path.join(directory_path, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        # least recently used first; get() touches the files it reads
+        entries = sorted(self._entries())
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_bytes -= size
+        self._total_bytes = total_bytes
+
+    def clear(self):
+        for _, _, path in self._entries():
+            os.remove(path)
+        self._total_bytes = 0
@@ -0,0 +1,57 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from general.input_source import InputSource
+
+NEWLINE = ord("\n")
+CARRIAGE_RETURN = ord("\r")
+ZERO = ord("0")
+
+
+def buffer_to_grid(buffer) -> np.ndarray:
+    # a read-only (rows, width) view on the raw bytes: the newlines are skipped via the row stride, nothing is copied
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    if len(raw) == 0:
+        return raw.reshape(0, 0)
+    first_newline = buffer.find(b"\n")
+    if first_newline == -1:
+        return raw.reshape(1, len(raw))
+    width = first_newline
+    if width > 0 and raw[width - 1] == CARRIAGE_RETURN:
+        width -= 1
+    row_stride = first_newline + 1
+    if raw[-1] == NEWLINE:
+        row_count, rest = divmod(len(raw), row_stride)
+    else:
+        row_count, rest = divmod(len(raw) - width, row_stride)
+        row_count += 1
+    if rest != 0:
+        raise ValueError("All rows of a grid must have the same width")
+    return np.lib.stride_tricks.as_strided(raw, shape=(row_count, width), strides=(row_stride, 1), writeable=False)
+
+
+def find_digit_runs(raw: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # (starts, exclusive ends, values) of every run of consecutive digit bytes, in order of appearance
+    is_digit = (raw - ZERO) < 10
+    edges = np.diff(is_digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return starts, ends, np.zeros(0, dtype=np.int64)
+    lengths = ends - starts
+    digit_positions = np.flatnonzero(is_digit)
+    run_of_digit = np.repeat(np.arange(len(starts)), lengths)
+    place_values = 10 ** (ends[run_of_digit] - 1 - digit_positions)
+    digit_values = (raw[digit_positions] - ZERO).astype(np.int64) * place_values
+    values = np.add.reduceat(digit_values, np.cumsum(lengths) - lengths)
+    return starts, ends, values
+
+
+def load_grid(source: InputSource, digits: bool = False, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    grid = buffer_to_grid(source.buffer())
+    if digits:
+        return np.subtract(grid, ZERO, dtype=dtype or np.uint8)
+    if dtype is not None:
+        return grid.astype(dtype)
+    return grid
@@ -0,0 +1,208 @@
+import argparse
+import random
+import string
+import sys
+from typing import Callable, Dict, List, Optional
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+CUBE_COLORS = ["red", "green", "blue"]
+SCHEMATIC_SYMBOLS = "*#+$/@=%-&"
+ALMANAC_CATEGORIES = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+NODE_NAME_ALPHABET = string.ascii_uppercase[1:-1]  # without "A" and "Z", which mark start and end nodes
+
+
+def generate_day_1(size: int, rng: random.Random) -> str:
+    # size: number of calibration lines
+    lines: List[str] = []
+    for _ in range(size):
+        parts: List[str] = []
+        for _ in range(rng.randint(2, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                parts.append(rng.choice(string.digits[1:]))
+            elif kind < 0.55:
+                parts.append(rng.choice(DIGIT_WORDS))
+            else:
+                parts.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 6))))
+        parts.insert(rng.randint(0, len(parts)), rng.choice(string.digits[1:]))
+        lines.append("".join(parts))
+    return "\n".join(lines)
+
+
+def generate_day_2(size: int, rng: random.Random) -> str:
+    # size: number of games
+    lines: List[str] = []
+    for game_id in range(1, size + 1):
+        draws: List[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(CUBE_COLORS, rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: {'; '.join(draws)}")
+    return "\n".join(lines)
+
+
+def generate_day_3(size: int, rng: random.Random) -> str:
+    # size: width and height of the square schematic
+    rows: List[str] = []
+    for _ in range(size):
+        row: List[str] = []
+        while len(row) < size:
+            kind = rng.random()
+            if kind < 0.08:
+                row.extend(str(rng.randint(1, 999)))
+            elif kind < 0.12:
+                row.append(rng.choice(SCHEMATIC_SYMBOLS))
+            else:
+                row.append(".")
+            row.append(".")
+        rows.append("".join(row[:size]))
+    return "\n".join(rows)
+
+
+def generate_day_4(size: int, rng: random.Random, winning_count: int = 10, my_count: int = 25) -> str:
+    # size: number of cards. Match counts mostly stay low (as in the real input) so copy counts do not explode,
+    # and no card wins copies of cards past the end of the table
+    id_width = len(str(size))
+    match_count_weights = [4 ** -match_count for match_count in range(winning_count + 1)]
+    lines: List[str] = []
+    for card_id in range(1, size + 1):
+        winning_numbers = rng.sample(range(1, 100), winning_count)
+        match_count = rng.choices(range(winning_count + 1), weights=match_count_weights)[0]
+        match_count = min(match_count, size - card_id)
+        losing_numbers = [number for number in range(1, 100) if number not in winning_numbers]
+        my_numbers = rng.sample(winning_numbers, match_count) + rng.sample(losing_numbers, my_count - match_count)
+        rng.shuffle(my_numbers)
+        lines.append(f"Card {card_id:>{id_width}}: "
+                     f"{' '.join(f'{number:>2}' for number in winning_numbers)} | "
+                     f"{' '.join(f'{number:>2}' for number in my_numbers)}")
+    return "\n".join(lines)
+
+
+def generate_day_5(size: int,
+                   rng: random.Random,
+                   seed_pair_count: int = 10,
+                   domain: int = 2 ** 32,
+                   layer_count: int = len(ALMANAC_CATEGORIES) - 1,
+                   ) -> str:
+    # size: number of range lines per map block; every block permutes consecutive segments of the domain
+    categories = ALMANAC_CATEGORIES
+    if layer_count != len(ALMANAC_CATEGORIES) - 1:
+        categories = [f"layer{index}" for index in range(layer_count + 1)]
+    seed_numbers: List[int] = []
+    for _ in range(seed_pair_count):
+        start = rng.randrange(domain)
+        seed_numbers.extend([start, rng.randint(1, max(1, (domain - start) // 100))])
+    blocks = [f"seeds: {' '.join(str(number) for number in seed_numbers)}"]
+    for source, destination in zip(categories, categories[1:]):
+        cut_points = sorted(rng.sample(range(1, domain), size - 1)) if size > 1 else []
+        boundaries = [0] + cut_points + [domain]
+        lengths = [end - start for start, end in zip(boundaries, boundaries[1:])]
+        destination_order = list(range(size))
+        rng.shuffle(destination_order)
+        destination_starts: Dict[int, int] = {}
+        destination_start = 0
+        for segment in destination_order:
+            destination_starts[segment] = destination_start
+            destination_start += lengths[segment]
+        lines = [f"{source}-to-{destination} map:"]
+        for segment in range(size):
+            lines.append(f"{destination_starts[segment]} {boundaries[segment]} {lengths[segment]}")
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks)
+
+
+def _node_name(index: int, width: int) -> str:
+    name = ""
+    for _ in range(width):
+        index, remainder = divmod(index, len(NODE_NAME_ALPHABET))
+        name += NODE_NAME_ALPHABET[remainder]
+    return name
+
+
+def generate_day_8(size: int, rng: random.Random, instruction_count: int = 263, ghost_count: int = 6) -> str:
+    # size: approximate number of nodes. Every ghost walks a ring whose length is a distinct prime multiple of
+    # the instruction count; its "..Z" node continues like its "..A" node, so the first arrival repeats forever.
+    # instruction_count is an upper bound: the instructions are shortened so the rings add up to about size nodes
+    multipliers = PRIMES[:ghost_count]
+    scale = max(1, size // (instruction_count * sum(multipliers)))
+    instruction_count = max(1, size // (scale * sum(multipliers)))
+    instructions = "".join(rng.choice("LR") for _ in range(instruction_count))
+    ring_lengths = [multiplier * scale * instruction_count + 1 for multiplier in multipliers]
+    name_width = 3
+    while len(NODE_NAME_ALPHABET) ** name_width < sum(ring_lengths):
+        name_width += 1
+
+    node_count = 0
+    rings: List[List[str]] = []
+    for ghost, ring_length in enumerate(ring_lengths):
+        ring = [_node_name(node_count + i, name_width) for i in range(ring_length)]
+        node_count += ring_length
+        prefix = _node_name(ghost, name_width - 1)
+        ring[0] = "AAA" if ghost == 0 else prefix + "A"
+        ring[-1] = "ZZZ" if ghost == 0 else prefix + "Z"
+        rings.append(ring)
+
+    all_names = [name for ring in rings for name in ring]
+    lines = [instructions, ""]
+    for ring in rings:
+        for position, name in enumerate(ring):
+            # the end node is visited at a multiple of the instruction count and takes the start node's place
+            next_name = ring[position + 1] if position + 1 < len(ring) else ring[1]
+            decoy_name = rng.choice(all_names)
+            direction = instructions[position % instruction_count]
+            left, right = (next_name, decoy_name) if direction == "L" else (decoy_name, next_name)
+            lines.append(f"{name} = ({left}, {right})")
+    header, body = lines[:2], lines[2:]
+    rng.shuffle(body)
+    return "\n".join(header + body)
+
+
+def generate_day_14(size: int, rng: random.Random) -> str:
+    # size: width and height of the square platform
+    return "\n".join("".join(rng.choices("O#.", weights=(2, 1, 5), k=size)) for _ in range(size))
+
+
+def generate_day_17(size: int, rng: random.Random) -> str:
+    # size: width and height of the square city map
+    return "\n".join("".join(rng.choices(string.digits[1:], k=size)) for _ in range(size))
+
+
+GENERATORS: Dict[str, Callable[[int, random.Random], str]] = {
+    "day_1": generate_day_1,
+    "day_2": generate_day_2,
+    "day_3": generate_day_3,
+    "day_4": generate_day_4,
+    "day_5": generate_day_5,
+    "day_8": generate_day_8,
+    "day_14": generate_day_14,
+    "day_17": generate_day_17,
+}
+
+
+def generate(day: str, size: int, seed: int = 0) -> str:
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def write_input(file_name: str, day: str, size: int, seed: int = 0):
+    with open(file_name, "w") as file:
+        file.write(generate(day, size, seed))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input.")
+    parser.add_argument("day", choices=GENERATORS.keys())
+    parser.add_argument("size", type=int, help="lines, cards, games, nodes or grid side, depending on the day")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="defaults to stdout")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        write_input(args.output, args.day, args.size, args.seed)
+    else:
+        sys.stdout.write(generate(args.day, args.size, args.seed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import hashlib
+import mmap
+import os
+from typing import Iterator, List, Optional, Tuple, Union
+
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class InputSource:
+    def __init__(self,
+                 file_name: str,
+                 mmap_threshold: int = MMAP_THRESHOLD_BYTES,
+                 ):
+        self.file_name = file_name
+        self.mmap_threshold = mmap_threshold
+        self._buffer: Optional[Union[bytes, mmap.mmap]] = None
+        self._file = None
+        self._lines: Optional[List[str]] = None
+        self._digest: Optional[str] = None
+
+    def size(self) -> int:
+        return os.path.getsize(self.file_name)
+
+    def iter_lines(self) -> Iterator[str]:
+        if self._lines is not None:
+            yield from self._lines
+            return
+        with open(self.file_name, "r") as file:
+            for line in file:
+                yield line.removesuffix("\n")
+
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = list(self.iter_lines())
+        return self._lines
+
+    def buffer(self) -> Union[bytes, mmap.mmap]:
+        # one shared read-only view of the raw bytes; large files are mapped instead of copied
+        if self._buffer is None:
+            size = self.size()
+            if 0 < size and self.mmap_threshold <= size:
+                self._file = open(self.file_name, "rb")
+                self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                with open(self.file_name, "rb") as file:
+                    self._buffer = file.read()
+        return self._buffer
+
+    def text(self) -> str:
+        return self.buffer()[:].decode().replace("\r\n", "\n")
+
+    def digest(self) -> str:
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.buffer()).hexdigest()
+        return self._digest
+
+    def iter_chunks(self,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    start: int = 0,
+                    end: Optional[int] = None,
+                    ) -> Iterator[bytes]:
+        # chunks always end on a line boundary, so every chunk holds whole lines only
+        if end is None:
+            end = self.size()
+        remainder = b""
+        with open(self.file_name, "rb") as file:
+            file.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = file.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                chunk = remainder + chunk
+                last_newline = chunk.rfind(b"\n")
+                if last_newline == -1:
+                    remainder = chunk
+                    continue
+                remainder = chunk[last_newline + 1:]
+                yield chunk[:last_newline + 1]
+        if remainder:
+            yield remainder
+
+    def byte_ranges(self, count: int) -> List[Tuple[int, int]]:
+        # roughly equal (start, end) ranges that each begin at the start of a line
+        size = self.size()
+        boundaries = [0]
+        with open(self.file_name, "rb") as file:
+            for index in range(1, count):
+                file.seek(max(size * index // count, boundaries[-1]))
+                file.readline()
+                boundaries.append(min(file.tell(), size))
+        boundaries.append(size)
+        return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                # arrays parsed from the buffer still point into the mapping, it is unmapped once they are gone
+                pass
+        if self._file is not None:
+            self._file.close()
+        self._buffer = None
+        self._file = None
@@ -0,0 +1,73 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+
+class IntervalSet:
+    # Disjoint, sorted inclusive intervals kept as two parallel lists, so the intervals touched by a new one are
+    # found with two binary searches. Overlapping or adjacent intervals are always merged
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+
+    def add(self, start: int, end: int):
+        # the first interval ending at or after start - 1 up to the last one starting at or before end + 1 merge
+        first = bisect_left(self.ends, start - 1)
+        last = bisect_right(self.starts, end + 1)
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __getitem__(self, index) -> Tuple[int, int]:
+        return self.starts[index], self.ends[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)})"
+
+    def to_arrays(self):
+        import numpy as np
+        return np.array(self.starts, dtype=np.int64), np.array(self.ends, dtype=np.int64)
+
+    @staticmethod
+    def from_intervals(intervals: Iterable[Tuple[int, int]]) -> 'IntervalSet':
+        # sort once and sweep, instead of n inserts into the middle of the lists
+        interval_set = IntervalSet()
+        starts, ends = interval_set.starts, interval_set.ends
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1] + 1:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        return interval_set
+
+    @staticmethod
+    def from_arrays(starts, ends) -> 'IntervalSet':
+        # the same sort and sweep on NumPy arrays: an interval starts a new group when it begins past the furthest
+        # end of all intervals before it
+        import numpy as np
+        interval_set = IntervalSet()
+        if len(starts) == 0:
+            return interval_set
+        order = np.lexsort((ends, starts))
+        starts = np.asarray(starts, dtype=np.int64)[order]
+        ends = np.asarray(ends, dtype=np.int64)[order]
+        reach = np.maximum.accumulate(ends)
+        is_group_start = np.concatenate(([True], starts[1:] > reach[:-1] + 1))
+        group_starts = np.flatnonzero(is_group_start)
+        interval_set.starts = starts[group_starts].tolist()
+        interval_set.ends = np.maximum.reduceat(ends, group_starts).tolist()
+        return interval_set
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
 
-from general.utils import read_lines
+from general.input_source import InputSource
+from general.profiling import profiling_enabled_by_environment, run_profiled
+
+if TYPE_CHECKING:
+    # pickle and tempfile are only needed once a cache is actually passed in
+    from general.cache import ResultCache
 
 
 class IProblemSolver(ABC):
@@ -9,19 +14,62 @@ class IProblemSolver(ABC):
                  input_file_name: str = "input.txt",
                  smaller_input_file_name: str = "smaller_input.txt",
                  use_smaller_input: bool = False,
+                 profile: Optional[bool] = None,
+                 cache: Optional['ResultCache'] = None,
                  ):
         if use_smaller_input:
             self.input_file_name = smaller_input_file_name
         else:
             self.input_file_name = input_file_name
-        self.lines = read_lines(self.input_file_name)
+        self.input = InputSource(self.input_file_name)
+        if profile is None:
+            profile = profiling_enabled_by_environment()
+        self.profile = profile
+        self.cache = cache
+        self._parsed: Any = None
+        self._is_parsed = False
+
+    @property
+    def lines(self) -> List[str]:
+        return self.input.lines()
+
+    def parse(self) -> Any:
+        # solvers that stream self.input themselves have nothing to parse up front
+        return None
+
+    @property
+    def parsed(self) -> Any:
+        if not self._is_parsed:
+            self._parsed = self._cached("parse", self.parse)
+            self._is_parsed = True
+        return self._parsed
 
     def solve(self):
         return {
-            "solution_part_1": self.solve_part_1(),
-            "solution_part_2": self.solve_part_2(),
+            "solution_part_1": self.run_part(1),
+            "solution_part_2": self.run_part(2),
         }
 
+    def run_part(self, part: int) -> Any:
+        solve_part = self.solve_part_1 if part == 1 else self.solve_part_2
+        return self._cached(f"part_{part}", lambda: self._run_part(f"part {part}", solve_part))
+
+    def _run_part(self, label: str, solve_part: Callable[[], Any]) -> Any:
+        if not self.profile:
+            return solve_part()
+        return run_profiled(f"{type(self).__module__}.{type(self).__name__} {label}", solve_part)
+
+    def _cached(self, kind: str, compute: Callable[[], Any]) -> Any:
+        if self.cache is None:
+            return compute()
+        key = self.cache.key(self, kind)
+        value, success = self.cache.get(key)
+        if success:
+            return value
+        value = compute()
+        self.cache.put(key, value)
+        return value
+
     @abstractmethod
     def solve_part_1(self):
         pass
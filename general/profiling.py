@@ -0,0 +1,50 @@
+import io
+import os
+import sys
+from typing import Any, Callable, TextIO, Tuple
+
+PROFILE_ENVIRONMENT_VARIABLE = "AOC_PROFILE"
+DEFAULT_TOP_FUNCTIONS = 15
+
+
+def profiling_enabled_by_environment() -> bool:
+    return os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, "").lower() not in ("", "0", "false", "no")
+
+
+def profile_call(func: Callable[[], Any], top: int = DEFAULT_TOP_FUNCTIONS) -> Tuple[Any, str, int]:
+    # imported here because every solver imports this module and pstats alone costs ~15ms of startup
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    already_tracing = tracemalloc.is_tracing()
+    if already_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    stats_output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stats_output)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return result, stats_output.getvalue(), peak_memory
+
+
+def format_profile(label: str, hot_functions: str, peak_memory: int) -> str:
+    return f"===== {label}: peak memory {peak_memory / 1024:.1f} KiB =====\n{hot_functions}"
+
+
+def run_profiled(label: str,
+                 func: Callable[[], Any],
+                 top: int = DEFAULT_TOP_FUNCTIONS,
+                 stream: TextIO = sys.stderr,
+                 ) -> Any:
+    result, hot_functions, peak_memory = profile_call(func, top=top)
+    print(format_profile(label, hot_functions, peak_memory), file=stream)
+    return result
@@ -0,0 +1,102 @@
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from general.benchmark import to_jsonable
+from general.cache import ResultCache, cache_disabled_by_environment
+from general.solver_discovery import SolverSpec, discover_solvers
+
+THREAD_LIMIT_VARIABLES = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def _init_worker():
+    # every core already runs its own solver, so numpy must not spawn extra BLAS threads on top
+    for variable in THREAD_LIMIT_VARIABLES:
+        os.environ.setdefault(variable, "1")
+
+
+def create_cache(use_cache: bool) -> Optional[ResultCache]:
+    if not use_cache or cache_disabled_by_environment():
+        return None
+    return ResultCache()
+
+
+def run_solver(spec: SolverSpec, input_file_name: str, use_cache: bool = False) -> Dict[str, Any]:
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    answers: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        solver = spec.create(input_file_name, cache=create_cache(use_cache))
+        for part in (1, 2):
+            try:
+                answers[f"part_{part}"] = to_jsonable(solver.run_part(part))
+            except Exception as e:
+                errors[f"part_{part}"] = repr(e)
+    return {
+        "solver": spec.name,
+        "answers": answers,
+        "errors": errors,
+        "wall_time": time.perf_counter() - wall_start,
+        "cpu_time": time.process_time() - cpu_start,
+    }
+
+
+def run_all(specs: List[SolverSpec],
+            max_workers: Optional[int] = None,
+            use_smaller_input: bool = False,
+            use_cache: bool = False,
+            ) -> Dict[str, Any]:
+    jobs = [(spec, spec.input_file(use_smaller_input)) for spec in specs]
+    jobs = [(spec, input_file_name) for spec, input_file_name in jobs if os.path.exists(input_file_name)]
+
+    # spawn instead of fork: workers import numpy themselves after the thread limits are set
+    context = multiprocessing.get_context("spawn")
+    wall_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker) as executor:
+        futures = [executor.submit(run_solver, spec, input_file_name, use_cache) for spec, input_file_name in jobs]
+        results = [future.result() for future in futures]
+    wall_time = time.perf_counter() - wall_start
+
+    cpu_time = sum(result["cpu_time"] for result in results)
+    return {
+        "results": results,
+        "wall_time": wall_time,
+        "cpu_time": cpu_time,
+        "speedup": cpu_time / wall_time if wall_time > 0 else 0.0,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run every day_* solver concurrently.")
+    parser.add_argument("--workers", type=int, default=None, help="defaults to the number of cores")
+    parser.add_argument("--day", action="append", dest="days", help="only run e.g. day_5 (repeatable)")
+    parser.add_argument("--smaller-input", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not fill the on-disk result cache")
+    args = parser.parse_args(argv)
+
+    report = run_all(discover_solvers(days=args.days),
+                     max_workers=args.workers,
+                     use_smaller_input=args.smaller_input,
+                     use_cache=not args.no_cache)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    for result in report["results"]:
+        print(f"{result['solver']:<45} {result['answers']} "
+              f"({result['wall_time']:.3f}s){' errors: ' + str(result['errors']) if result['errors'] else ''}")
+    print(f"wall: {report['wall_time']:.3f}s, summed cpu: {report['cpu_time']:.3f}s, "
+          f"speedup: {report['speedup']:.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
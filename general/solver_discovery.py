@@ -0,0 +1,73 @@
+import glob
+import importlib
+import inspect
+import os
+from typing import List, Optional, Type
+
+from general.problem_solver_interface import IProblemSolver
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SolverSpec:
+    def __init__(self,
+                 day: str,
+                 module_name: str,
+                 class_name: str,
+                 directory: str,
+                 ):
+        self.day = day
+        self.module_name = module_name
+        self.class_name = class_name
+        self.directory = directory
+
+    @property
+    def name(self) -> str:
+        return f"{self.module_name}.{self.class_name}"
+
+    def input_file(self, use_smaller_input: bool = False) -> str:
+        file_name = "smaller_input.txt" if use_smaller_input else "input.txt"
+        return os.path.join(self.directory, file_name)
+
+    def load_class(self) -> Type[IProblemSolver]:
+        module = importlib.import_module(self.module_name)
+        return getattr(module, self.class_name)
+
+    def create(self, input_file_name: Optional[str] = None, **kwargs) -> IProblemSolver:
+        if input_file_name is None:
+            input_file_name = self.input_file()
+        return self.load_class()(input_file_name=input_file_name, **kwargs)
+
+    def __str__(self):
+        return self.name
+
+
+def _day_number(directory: str) -> int:
+    return int(os.path.basename(directory).removeprefix("day_"))
+
+
+def discover_solvers(root: str = REPO_ROOT, days: Optional[List[str]] = None) -> List[SolverSpec]:
+    specs: List[SolverSpec] = []
+    day_directories = sorted(glob.glob(os.path.join(root, "day_*")), key=_day_number)
+    for directory in day_directories:
+        day = os.path.basename(directory)
+        if days is not None and day not in days:
+            continue
+        for path in sorted(glob.glob(os.path.join(directory, "*.py"))):
+            module_stem = os.path.basename(path).removesuffix(".py")
+            if module_stem.startswith("test_"):
+                continue
+            module_name = f"{day}.{module_stem}"
+            module = importlib.import_module(module_name)
+            for class_name, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module_name \
+                        or not issubclass(cls, IProblemSolver) \
+                        or inspect.isabstract(cls):
+                    continue
+                specs.append(SolverSpec(
+                    day=day,
+                    module_name=module_name,
+                    class_name=class_name,
+                    directory=directory,
+                ))
+    return specs
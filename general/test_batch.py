@@ -0,0 +1,44 @@
+from day_14.solution import ProblemSolver
+from general.batch import solve_file
+from general.input_source import InputSource
+
+
+class MappedProblemSolver(ProblemSolver):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.input.mmap_threshold = 1
+
+
+class BrokenProblemSolver(ProblemSolver):
+    def __init__(self, *args, **kwargs):
+        raise ValueError("broken")
+
+
+def test_solve_file_should_close_mapped_input_with_parsed_views():
+    # act
+    result = solve_file(MappedProblemSolver, "day_14/smaller_input.txt")
+
+    # assert
+    assert result["errors"] == {}
+    assert (result["part_1"], result["part_2"]) == (136, 68)
+
+
+def test_close_should_leave_mapping_to_views_still_in_use():
+    # arrange
+    input_source = InputSource("day_14/smaller_input.txt", mmap_threshold=1)
+    view = memoryview(input_source.buffer())
+
+    # act
+    input_source.close()
+
+    # assert
+    assert view[0] == ord("O")
+
+
+def test_solve_file_should_record_construction_errors():
+    # act
+    result = solve_file(BrokenProblemSolver, "day_14/smaller_input.txt")
+
+    # assert
+    assert result["errors"] == {"init": "ValueError('broken')"}
+    assert "part_1" not in result and "seconds" in result
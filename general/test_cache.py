@@ -0,0 +1,37 @@
+import sys
+
+from day_5.solution_part_2 import ProblemSolver
+from general.cache import ResultCache, repo_dependencies
+
+
+class CachedValue:
+    pass
+
+
+def test_key_should_change_with_imported_repo_module(tmp_path):
+    # arrange
+    cache = ResultCache(directory=str(tmp_path))
+    solver = ProblemSolver(input_file_name="day_5/smaller_input.txt")
+    key = cache.key(solver, "part_2")
+
+    # act
+    edited_cache = ResultCache(directory=str(tmp_path))
+    edited_cache._source_digests["general.interval_set"] = "edited"
+    edited_key = edited_cache.key(solver, "part_2")
+
+    # assert
+    assert "general.interval_set" in repo_dependencies(ProblemSolver)
+    assert edited_key != key
+
+
+def test_get_should_miss_on_class_that_no_longer_exists(tmp_path, monkeypatch):
+    # arrange
+    cache = ResultCache(directory=str(tmp_path))
+    cache.put("ab" * 32, CachedValue())
+    monkeypatch.delattr(sys.modules[__name__], "CachedValue")
+
+    # act
+    value, success = cache.get("ab" * 32)
+
+    # assert
+    assert (value, success) == (None, False)
@@ -0,0 +1,32 @@
+import random
+
+import numpy as np
+
+from general.interval_set import IntervalSet
+
+
+def covered_points(interval_set: IntervalSet):
+    return {point for start, end in interval_set for point in range(start, end + 1)}
+
+
+def test_add_and_bulk_construction_should_agree():
+    rng = random.Random(23)
+    for _ in range(200):
+        # arrange
+        intervals = []
+        for _ in range(rng.randint(0, 30)):
+            start = rng.randint(-50, 50)
+            intervals.append((start, start + rng.randint(0, 8)))
+
+        # act
+        added = IntervalSet()
+        for start, end in intervals:
+            added.add(start, end)
+        from_intervals = IntervalSet.from_intervals(intervals)
+        from_arrays = IntervalSet.from_arrays(np.array([start for start, _ in intervals], dtype=np.int64),
+                                              np.array([end for _, end in intervals], dtype=np.int64))
+
+        # assert
+        assert added == from_intervals == from_arrays
+        assert covered_points(added) == {point for start, end in intervals for point in range(start, end + 1)}
+        assert all(end + 1 < next_start for end, next_start in zip(added.ends, added.starts[1:]))
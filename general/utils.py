@@ -1,7 +1,5 @@
 from typing import List
 
-import numpy as np
-
 
 def read_lines(file_name: str) -> List[str]:
     file = open(file_name, "r")
@@ -24,11 +22,3 @@ def try_parse_int(value):
         return int(value), True
     except ValueError:
         return value, False
-
-
-def lines_to_array(lines: List[str]) -> np.ndarray:
-    return np.array([[char for char in line] for line in lines], str)
-
-
-def lines_to_int_array(lines: List[str]) -> np.ndarray:
-    return np.array([[char for char in line] for line in lines], int)
\ No newline at end of file